@@ -1,5 +1,14 @@
 """Favro CLI - Command line interface for Favro project management."""
 
-from importlib.metadata import version
+from typing import Any
 
-__version__ = version("favro-cli")
+
+def __getattr__(name: str) -> Any:
+    # Resolve the version on first use rather than reading the package
+    # metadata on every invocation; the result is kept as a module global.
+    if name == "__version__":
+        from importlib.metadata import version
+
+        value = globals()["__version__"] = version("favro-cli")
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,9 +1,23 @@
 """Favro API client."""
 
-from typing import Any, TypeVar
+import atexit
+import functools
+import importlib.util
+import threading
+from collections.abc import Callable, Hashable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Generic, TypeVar
 
 import httpx
-
+from pydantic import BaseModel, Field
+
+from favro_cli import __version__
+from favro_cli.api.errors import (
+    FavroAPIError,
+    FavroAuthError,
+    FavroNotFoundError,
+    FavroRateLimitError,
+)
 from favro_cli.api.models import (
     Card,
     Collection,
@@ -16,41 +30,97 @@ from favro_cli.api.models import (
 
 
 T = TypeVar("T")
+M = TypeVar("M", bound=BaseModel)
 
 BASE_URL = "https://favro.com/api/v1"
+MAX_CONNECTIONS = 8
+CONNECT_RETRIES = 2
+
+
+def _card_params(
+    widget_common_id: str | None,
+    collection_id: str | None,
+    column_id: str | None,
+    todo_list: bool,
+    unique: bool,
+    sequential_id: int | None,
+) -> dict[str, str]:
+    """Build the query parameters for listing cards."""
+    params: dict[str, str] = {"unique": "true" if unique else "false"}
+    if widget_common_id:
+        params["widgetCommonId"] = widget_common_id
+    if collection_id:
+        params["collectionId"] = collection_id
+    if column_id:
+        params["columnId"] = column_id
+    if todo_list:
+        params["todoList"] = "true"
+    if sequential_id is not None:
+        params["cardSequentialId"] = str(sequential_id)
+    return params
+
+
+class _EntityPage(BaseModel, Generic[M]):
+    """One page of a paginated endpoint, decoded straight into models."""
+
+    entities: list[M] = Field(default_factory=list)
+    request_id: str | None = Field(default=None, alias="requestId")
+    pages: int = 1
+    message: str | None = None
+
+
+class _SharedTransport(httpx.BaseTransport):
+    """Connection pool shared by every client in the process.
+
+    Closing a client leaves the pool open, so a later client (for example
+    the next command when several run in one process) reuses its keep-alive
+    connections instead of doing a fresh TCP and TLS handshake. The pool is
+    closed at exit.
+
+    HTTP/2 is negotiated when the optional h2 package is installed
+    (`pip install favro-cli[http2]`), so concurrent requests are multiplexed
+    over one connection. Otherwise HTTP/1.1 keep-alive connections are pooled.
+    """
+
+    def __init__(self) -> None:
+        self._transport = httpx.HTTPTransport(
+            http2=importlib.util.find_spec("h2") is not None,
+            retries=CONNECT_RETRIES,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_CONNECTIONS,
+            ),
+        )
+        atexit.register(self._transport.close)
 
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        return self._transport.handle_request(request)
 
-class FavroAPIError(Exception):
-    """Base exception for Favro API errors."""
-
-    def __init__(self, status_code: int, message: str) -> None:
-        self.status_code = status_code
-        self.message = message
-        super().__init__(f"HTTP {status_code}: {message}")
-
-
-class FavroAuthError(FavroAPIError):
-    """Authentication error."""
-
-    pass
-
-
-class FavroNotFoundError(FavroAPIError):
-    """Resource not found error."""
+    def close(self) -> None:
+        pass  # Kept open for the next client, closed at exit
 
-    pass
 
+_shared_transport: _SharedTransport | None = None
+_shared_transport_lock = threading.Lock()
 
-class FavroRateLimitError(FavroAPIError):
-    """Rate limit exceeded error."""
 
-    def __init__(self, message: str, reset_time: str | None = None) -> None:
-        super().__init__(429, message)
-        self.reset_time = reset_time
+def _get_shared_transport() -> _SharedTransport:
+    """Get the process-wide connection pool, creating it on first use."""
+    global _shared_transport
+    with _shared_transport_lock:
+        if _shared_transport is None:
+            _shared_transport = _SharedTransport()
+        return _shared_transport
 
 
 class FavroClient:
-    """Client for the Favro API."""
+    """Client for the Favro API.
+
+    Clients share one pooled httpx transport. Commands open a single
+    client and pass it to every resolver, so all requests in a command
+    reuse the same keep-alive (gzip-encoded) connections, and so do later
+    clients in the same process.
+    """
 
     def __init__(
         self,
@@ -62,14 +132,105 @@ class FavroClient:
         self.token = token
         self.organization_id = organization_id
         self._backend_identifier: str | None = None
+        self._memo: dict[Hashable, Any] = {}
+        self._memo_locks: dict[Hashable, threading.Lock] = {}
+        self._memo_guard = threading.Lock()
+        # Disk cache keys of the lists this client read from the cache
+        self._cached_list_keys: set[str] = set()
+        # Card responses fetched by this client, saved to the disk cache on close
+        self._fetched_cards: dict[str, tuple[str, str]] = {}
+        # Credentials are sent per request, so the pooled transport can be
+        # shared: every request (including concurrent ones) reuses keep-alive
+        # connections
         self._client = httpx.Client(
             base_url=BASE_URL,
             auth=(email, token),
             timeout=30.0,
+            headers={"User-Agent": f"favro-cli/{__version__}"},
+            transport=_get_shared_transport(),
         )
 
+    @property
+    def cache_scope(self) -> str | None:
+        """Key for this client's entries in the disk caches.
+
+        Entries belong to an account and organization, so one account never
+        reads another's. None (no disk caching) without an organization.
+        """
+        if self.organization_id is None:
+            return None
+        return f"{self.email}/{self.organization_id}"
+
+    def memoize(self, key: Hashable, fetch: Callable[[], T]) -> T:
+        """Return the result of fetch for key, calling it only once per client.
+
+        Used for the organization-wide lists (users, tags, boards, columns)
+        and by resolvers, so that lookups repeated within one command (for
+        example the user list for --add and --remove) hit the API once.
+        Concurrent callers with the same key wait for the first fetch.
+        """
+        with self._memo_guard:
+            if key in self._memo:
+                return self._memo[key]
+            key_lock = self._memo_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            with self._memo_guard:
+                if key in self._memo:
+                    return self._memo[key]
+            value = fetch()
+            with self._memo_guard:
+                self._memo[key] = value
+            return value
+
+    def forget(self, kind: str) -> None:
+        """Drop memoized and disk-cached lists of one kind, e.g. "columns".
+
+        Called after changes made through the client, and by resolvers that
+        couldn't find a name in a cached list.
+        """
+        from favro_cli.cache import clear_list_cache
+
+        with self._memo_guard:
+            stale = [k for k in self._memo if isinstance(k, tuple) and k[:1] == (kind,)]
+            for key in stale:
+                del self._memo[key]
+            self._cached_list_keys = {
+                k for k in self._cached_list_keys if k.partition(":")[0] != kind
+            }
+        scope = self.cache_scope
+        if scope:
+            clear_list_cache(scope, kind)
+
+    def used_cached_list(self, kind: str) -> bool:
+        """Check whether a list of this kind was read from the disk cache."""
+        with self._memo_guard:
+            return any(k.partition(":")[0] == kind for k in self._cached_list_keys)
+
+    def warmup(self) -> None:
+        """Open a pooled connection ahead of the first real request.
+
+        Does the DNS lookup and TCP and TLS handshakes with a HEAD request,
+        so a later request can reuse the connection. Failures are ignored;
+        the real request reports them.
+        """
+        try:
+            self._client.head("", timeout=5.0)
+        except httpx.HTTPError:
+            pass
+
     def close(self) -> None:
-        """Close the HTTP client."""
+        """Close the HTTP client. The shared connection pool stays open.
+
+        Card responses fetched by this client are written to the disk cache
+        here, once, rather than on every fetch.
+        """
+        with self._memo_guard:
+            fetched_cards, self._fetched_cards = self._fetched_cards, {}
+        scope = self.cache_scope
+        if fetched_cards and scope:
+            from favro_cli.cache import set_cached_cards
+
+            set_cached_cards(scope, fetched_cards)
         self._client.close()
 
     def __enter__(self) -> "FavroClient":
@@ -92,8 +253,8 @@ class FavroClient:
             headers["X-Favro-Backend-Identifier"] = self._backend_identifier
         return headers
 
-    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
-        """Handle API response and extract data."""
+    def _check_response(self, response: httpx.Response) -> None:
+        """Record routing headers and raise for API error statuses."""
         # Store backend identifier for routing
         backend_id = response.headers.get("X-Favro-Backend-Identifier")
         if backend_id:
@@ -111,6 +272,10 @@ class FavroClient:
         if response.status_code >= 400:
             raise FavroAPIError(response.status_code, response.text)
 
+    def _handle_response(self, response: httpx.Response) -> dict[str, Any]:
+        """Handle API response and extract data."""
+        self._check_response(response)
+
         if response.status_code == 204:
             return {}
 
@@ -176,32 +341,157 @@ class FavroClient:
         )
         return self._handle_response(response)
 
-    def _paginate_all(
+    def _get_entity_page(
+        self, path: str, params: dict[str, str]
+    ) -> tuple[list[dict[str, Any]], str | None, int]:
+        """Fetch one page of a paginated endpoint as raw entities.
+
+        Returns:
+            (entities, request ID for later pages, total page count)
+        """
+        data = self._get(path, params)
+        request_id: str | None = data.get("requestId")
+        total_pages = data.get("pages", 1)
+        if not isinstance(total_pages, int):
+            total_pages = 1
+        return data.get("entities", []), request_id, total_pages
+
+    def _get_model_page(
+        self, path: str, params: dict[str, str], model: type[M]
+    ) -> tuple[list[M], str | None, int]:
+        """Fetch one page of a paginated endpoint as validated models.
+
+        The response bytes are validated straight into models by pydantic-core,
+        without building intermediate dicts.
+        """
+        response = self._client.get(
+            path,
+            params=params,
+            headers=self._get_headers(),
+        )
+        self._check_response(response)
+        if response.status_code == 204:
+            return [], None, 1
+        page = _EntityPage[model].model_validate_json(response.content)
+        # Check for error responses that come with 200 status
+        if page.message is not None and not page.entities:
+            raise FavroAPIError(200, page.message)
+        return page.entities, page.request_id, page.pages
+
+    def _paginate(
         self,
         path: str,
         params: dict[str, str] | None = None,
-    ) -> list[dict[str, Any]]:
-        """Fetch all pages of a paginated endpoint."""
-        all_entities: list[dict[str, Any]] = []
+        prefetch: bool = False,
+        model: type[M] | None = None,
+    ) -> Iterator[Any]:
+        """Yield entities from a paginated endpoint, fetching pages on demand.
+
+        Args:
+            path: Endpoint path
+            params: Query parameters
+            prefetch: Fetch the next page in the background while the current
+                one is consumed. Use when the caller reads every page.
+            model: Validate entities into this model as each page is decoded.
+                Without it, entities are yielded as dicts.
+        """
         params = params or {}
+        get_page: Callable[
+            [str, dict[str, str]], tuple[list[Any], str | None, int]
+        ] = (
+            self._get_entity_page
+            if model is None
+            else functools.partial(self._get_model_page, model=model)
+        )
 
         # First request
-        data = self._get(path, params)
-        all_entities.extend(data.get("entities", []))
+        entities, request_id, total_pages = get_page(path, params)
 
         # Get subsequent pages
-        request_id: str | None = data.get("requestId")
-        total_pages = data.get("pages", 1)
-        if not isinstance(total_pages, int):
-            total_pages = 1
+        if not request_id or total_pages <= 1:
+            yield from entities
+            return
 
-        if request_id:
+        if not prefetch:
+            yield from entities
             for page in range(1, total_pages):
                 page_params = {**params, "requestId": request_id, "page": str(page)}
-                data = self._get(path, page_params)
-                all_entities.extend(data.get("entities", []))
+                entities, _, _ = get_page(path, page_params)
+                yield from entities
+            return
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            for page in range(1, total_pages):
+                page_params = {**params, "requestId": request_id, "page": str(page)}
+                next_page = executor.submit(get_page, path, page_params)
+                yield from entities
+                entities, _, _ = next_page.result()
+            yield from entities
+
+    def _get_by_ids(
+        self,
+        list_key: Hashable,
+        fetch: Callable[[str], T],
+        ids: list[str],
+        get_id: Callable[[T], str],
+    ) -> list[T]:
+        """Get entities by ID, from a memoized full list if there is one."""
+        with self._memo_guard:
+            fetched: list[T] | None = self._memo.get(list_key)
+        if fetched is not None:
+            wanted = set(ids)
+            return [e for e in fetched if get_id(e) in wanted]
+        if not ids:
+            return []
+
+        def fetch_or_none(entity_id: str) -> T | None:
+            try:
+                return fetch(entity_id)
+            except FavroNotFoundError:
+                return None
+
+        with ThreadPoolExecutor(max_workers=min(len(ids), MAX_CONNECTIONS)) as executor:
+            return [e for e in executor.map(fetch_or_none, ids) if e is not None]
+
+    def _paginate_all(
+        self,
+        path: str,
+        params: dict[str, str] | None = None,
+    ) -> list[dict[str, Any]]:
+        """Fetch all pages of a paginated endpoint."""
+        return list(self._paginate(path, params, prefetch=True))
 
-        return all_entities
+    def _get_cached_list(
+        self,
+        cache_key: str,
+        model: type[M],
+        path: str,
+        params: dict[str, str] | None = None,
+    ) -> list[M]:
+        """Fetch all entities of a paginated endpoint via the disk cache.
+
+        Lists cached by an earlier command are used while they are fresh,
+        so resolving names often needs no request at all.
+        """
+        from favro_cli.cache import get_cached_list, set_cached_list
+
+        scope = self.cache_scope
+        if scope:
+            cached = get_cached_list(scope, cache_key)
+            if cached is not None:
+                try:
+                    entities = [model.model_validate(e) for e in cached]
+                except ValueError:
+                    pass  # Written by an incompatible version, refetch
+                else:
+                    with self._memo_guard:
+                        self._cached_list_keys.add(cache_key)
+                    return entities
+
+        data = self._paginate_all(path, params)
+        if scope:
+            set_cached_list(scope, cache_key, data)
+        return [model.model_validate(e) for e in data]
 
     # User endpoints
     def get_user(self, user_id: str) -> User:
@@ -210,9 +500,30 @@ class FavroClient:
         return User.model_validate(data)
 
     def get_users(self) -> list[User]:
-        """Get all users in the organization."""
-        entities = self._paginate_all("/users")
-        return [User.model_validate(e) for e in entities]
+        """Get all users in the organization (cached on disk for a while)."""
+        return self.memoize(
+            ("users",), lambda: self._get_cached_list("users", User, "/users")
+        )
+
+    def get_users_by_ids(self, user_ids: list[str]) -> list[User]:
+        """Get specific users, skipping IDs that aren't found.
+
+        Fetches just these users concurrently, unless the full user list was
+        already fetched by this client.
+        """
+        return self._get_by_ids(
+            ("users",), self.get_user, user_ids, lambda u: u.user_id
+        )
+
+    def find_user_by_email(self, email: str) -> User | None:
+        """Find a user in the organization by email.
+
+        Stops paging once the user is found and only validates the match.
+        """
+        for entity in self._paginate("/users"):
+            if entity.get("email") == email:
+                return User.model_validate(entity)
+        return None
 
     # Organization endpoints
     def get_organizations(self) -> list[Organization]:
@@ -245,12 +556,17 @@ class FavroClient:
         collection_id: str | None = None,
         archived: bool = False,
     ) -> list[Widget]:
-        """Get all widgets (boards) in the organization."""
+        """Get all widgets (boards) in the organization (fetched once per client)."""
         params: dict[str, str] = {"archived": "true" if archived else "false"}
         if collection_id:
             params["collectionId"] = collection_id
-        entities = self._paginate_all("/widgets", params)
-        return [Widget.model_validate(e) for e in entities]
+        return self.memoize(
+            ("widgets", collection_id, archived),
+            lambda: [
+                Widget.model_validate(e)
+                for e in self._paginate_all("/widgets", params)
+            ],
+        )
 
     def get_widget(self, widget_common_id: str) -> Widget:
         """Get a specific widget (board)."""
@@ -258,11 +574,36 @@ class FavroClient:
         return Widget.model_validate(data)
 
     # Column endpoints
-    def get_columns(self, widget_common_id: str) -> list[Column]:
-        """Get all columns for a widget."""
+    def get_columns(
+        self, widget_common_id: str, use_cache: bool = False, remember: bool = True
+    ) -> list[Column]:
+        """Get all columns for a widget.
+
+        Args:
+            widget_common_id: Widget to get the columns of
+            use_cache: Reuse a list cached on disk by an earlier command.
+                Only for resolving names; columns that are shown (with their
+                card counts) are always fetched fresh.
+            remember: Keep the columns for later calls on this client. Off
+                for speculative fetches, whose ID may not be a board at all.
+        """
         params = {"widgetCommonId": widget_common_id}
-        entities = self._paginate_all("/columns", params)
-        return [Column.model_validate(e) for e in entities]
+        if use_cache:
+            return self.memoize(
+                ("columns", widget_common_id, "cached"),
+                lambda: self._get_cached_list(
+                    f"columns:{widget_common_id}", Column, "/columns", params
+                ),
+            )
+
+        def fetch() -> list[Column]:
+            return [
+                Column.model_validate(c) for c in self._paginate_all("/columns", params)
+            ]
+
+        if not remember:
+            return fetch()
+        return self.memoize(("columns", widget_common_id), fetch)
 
     def get_column(self, column_id: str) -> Column:
         """Get a specific column."""
@@ -283,6 +624,7 @@ class FavroClient:
         if position is not None:
             data["position"] = position
         result = self._post("/columns", data)
+        self.forget("columns")
         return Column.model_validate(result)
 
     def update_column(
@@ -298,13 +640,51 @@ class FavroClient:
         if position is not None:
             data["position"] = position
         result = self._put(f"/columns/{column_id}", data)
+        self.forget("columns")
         return Column.model_validate(result)
 
     def delete_column(self, column_id: str) -> None:
         """Delete a column."""
         self._delete(f"/columns/{column_id}")
+        self.forget("columns")
 
     # Card endpoints
+    def iter_cards(
+        self,
+        widget_common_id: str | None = None,
+        collection_id: str | None = None,
+        column_id: str | None = None,
+        todo_list: bool = False,
+        unique: bool = True,
+        sequential_id: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[Card]:
+        """Iterate over cards in the organization, fetching pages on demand.
+
+        Pass prefetch=False when the caller may stop early, so no page is
+        fetched ahead that won't be read.
+        """
+        params = _card_params(
+            widget_common_id, collection_id, column_id, todo_list, unique, sequential_id
+        )
+        yield from self._paginate("/cards", params, prefetch=prefetch, model=Card)
+
+    def iter_raw_cards(
+        self,
+        widget_common_id: str | None = None,
+        collection_id: str | None = None,
+        column_id: str | None = None,
+        todo_list: bool = False,
+        unique: bool = True,
+        sequential_id: int | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[dict[str, Any]]:
+        """Iterate over cards as returned by the API, without validation."""
+        params = _card_params(
+            widget_common_id, collection_id, column_id, todo_list, unique, sequential_id
+        )
+        yield from self._paginate("/cards", params, prefetch=prefetch)
+
     def get_cards(
         self,
         widget_common_id: str | None = None,
@@ -312,25 +692,56 @@ class FavroClient:
         column_id: str | None = None,
         todo_list: bool = False,
         unique: bool = True,
+        sequential_id: int | None = None,
     ) -> list[Card]:
         """Get cards from the organization."""
-        params: dict[str, str] = {"unique": "true" if unique else "false"}
-        if widget_common_id:
-            params["widgetCommonId"] = widget_common_id
-        if collection_id:
-            params["collectionId"] = collection_id
-        if column_id:
-            params["columnId"] = column_id
-        if todo_list:
-            params["todoList"] = "true"
-        entities = self._paginate_all("/cards", params)
-        return [Card.model_validate(e) for e in entities]
+        return list(
+            self.iter_cards(
+                widget_common_id=widget_common_id,
+                collection_id=collection_id,
+                column_id=column_id,
+                todo_list=todo_list,
+                unique=unique,
+                sequential_id=sequential_id,
+            )
+        )
 
     def get_card(self, card_id: str) -> Card:
-        """Get a specific card."""
-        data = self._get(f"/cards/{card_id}")
+        """Get a specific card.
+
+        Responses are cached on disk with their ETag. When a card is cached,
+        the request is conditional and a 304 reply is served from the cache.
+        The cache file is read once per client and written on close.
+        """
+        with self._memo_guard:
+            cached = self._fetched_cards.get(card_id)
+        if cached is None:
+            cached = self._get_card_cache().get(card_id)
+        headers = self._get_headers()
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+
+        response = self._client.get(f"/cards/{card_id}", headers=headers)
+        if response.status_code == 304 and cached is not None:
+            return Card.model_validate_json(cached[1])
+
+        data = self._handle_response(response)
+        etag = response.headers.get("ETag")
+        if etag:
+            with self._memo_guard:
+                self._fetched_cards.pop(card_id, None)
+                self._fetched_cards[card_id] = (etag, response.text)
         return Card.model_validate(data)
 
+    def _get_card_cache(self) -> dict[str, tuple[str, str]]:
+        """Get the cached card responses, read once per client."""
+        from favro_cli.cache import get_cached_cards
+
+        scope = self.cache_scope
+        if scope is None:
+            return {}
+        return self.memoize(("card_cache",), lambda: get_cached_cards(scope))
+
     def create_card(
         self,
         name: str,
@@ -362,6 +773,8 @@ class FavroClient:
         if assignments:
             data["addAssignmentIds"] = assignments
         result = self._post("/cards", data)
+        # Column lists carry card counts
+        self.forget("columns")
         return Card.model_validate(result)
 
     def update_card(
@@ -410,18 +823,31 @@ class FavroClient:
         if list_position is not None:
             data["listPosition"] = list_position
         result = self._put(f"/cards/{card_id}", data)
+        if any(v is not None for v in (column_id, widget_common_id, archived)):
+            # The card may have left or joined a column, changing its count
+            self.forget("columns")
         return Card.model_validate(result)
 
     def delete_card(self, card_id: str, everywhere: bool = False) -> None:
         """Delete a card."""
         params = {"everywhere": "true"} if everywhere else None
         self._delete(f"/cards/{card_id}", params)
+        self.forget("columns")
 
     # Tag endpoints
     def get_tags(self) -> list[Tag]:
-        """Get all tags in the organization."""
-        entities = self._paginate_all("/tags")
-        return [Tag.model_validate(e) for e in entities]
+        """Get all tags in the organization (cached on disk for a while)."""
+        return self.memoize(
+            ("tags",), lambda: self._get_cached_list("tags", Tag, "/tags")
+        )
+
+    def get_tags_by_ids(self, tag_ids: list[str]) -> list[Tag]:
+        """Get specific tags, skipping IDs that aren't found.
+
+        Fetches just these tags concurrently, unless the full tag list was
+        already fetched by this client.
+        """
+        return self._get_by_ids(("tags",), self.get_tag, tag_ids, lambda t: t.tag_id)
 
     def get_tag(self, tag_id: str) -> Tag:
         """Get a specific tag."""
@@ -0,0 +1,34 @@
+"""Favro API error types.
+
+Kept free of third-party imports, so commands can catch API errors without
+loading the HTTP client.
+"""
+
+
+class FavroAPIError(Exception):
+    """Base exception for Favro API errors."""
+
+    def __init__(self, status_code: int, message: str) -> None:
+        self.status_code = status_code
+        self.message = message
+        super().__init__(f"HTTP {status_code}: {message}")
+
+
+class FavroAuthError(FavroAPIError):
+    """Authentication error."""
+
+    pass
+
+
+class FavroNotFoundError(FavroAPIError):
+    """Resource not found error."""
+
+    pass
+
+
+class FavroRateLimitError(FavroAPIError):
+    """Rate limit exceeded error."""
+
+    def __init__(self, message: str, reset_time: str | None = None) -> None:
+        super().__init__(429, message)
+        self.reset_time = reset_time
@@ -0,0 +1,277 @@
+"""Local cache for API lookups that rarely change.
+
+Entries are kept per scope: the account and organization they were fetched
+for (FavroClient.cache_scope).
+"""
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Any, cast
+
+from pydantic_core import from_json, to_json
+
+from favro_cli.api.models import Widget
+
+# Cached boards are served without a network call while fresh, and served
+# while a background refresh runs until they are stale.
+WIDGET_FRESH_SECONDS = 60 * 60
+WIDGET_STALE_SECONDS = 24 * 60 * 60
+
+# Organization-wide lists used to resolve names (users, tags, a board's
+# columns) are reused by later commands for this long. Changes made through
+# the CLI clear them.
+LIST_CACHE_SECONDS = 10 * 60
+
+# Card responses are kept with their ETag for conditional requests. Only the
+# most recently fetched cards are kept.
+CARD_CACHE_MAX_ENTRIES = 500
+
+# Held around each load-modify-save of a cache file, so that concurrent
+# lookups in one command don't overwrite each other's updates
+_cache_write_lock = threading.Lock()
+
+
+def get_cache_dir() -> Path:
+    """Get the cache directory path (XDG-compliant)."""
+    xdg_cache_home = os.environ.get("XDG_CACHE_HOME")
+    if xdg_cache_home:
+        base = Path(xdg_cache_home)
+    else:
+        base = Path.home() / ".cache"
+    return base / "favro-cli"
+
+
+def get_widget_cache_path() -> Path:
+    """Get the widget cache file path."""
+    return get_cache_dir() / "widgets.json"
+
+
+def get_list_cache_path() -> Path:
+    """Get the entity list cache file path."""
+    return get_cache_dir() / "lists.json"
+
+
+def get_card_cache_path() -> Path:
+    """Get the card response cache file path."""
+    return get_cache_dir() / "cards.json"
+
+
+def _load_cache_file(cache_path: Path) -> dict[str, dict[str, Any]]:
+    """Load a cache file. Returns an empty cache if missing or unreadable."""
+    try:
+        data: Any = from_json(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return cast(dict[str, dict[str, Any]], data)
+
+
+def _save_cache_file(cache_path: Path, cache: dict[str, dict[str, Any]]) -> None:
+    """Write a cache file atomically. Failures are ignored.
+
+    Each write goes through its own temporary file, so concurrent writers
+    (including other processes) never write into the same file.
+    """
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            dir=cache_path.parent, prefix=f"{cache_path.name}.", delete=False
+        ) as f:
+            f.write(to_json(cache))
+        try:
+            os.replace(f.name, cache_path)
+        except OSError:
+            os.unlink(f.name)
+            raise
+    except OSError:
+        pass
+
+
+def _load_widget_cache() -> dict[str, dict[str, Any]]:
+    """Load the widget cache. Returns an empty cache if missing or unreadable."""
+    return _load_cache_file(get_widget_cache_path())
+
+
+def _save_widget_cache(cache: dict[str, dict[str, Any]]) -> None:
+    """Write the widget cache atomically. Failures are ignored."""
+    _save_cache_file(get_widget_cache_path(), cache)
+
+
+def get_cached_widget(scope: str, key: str) -> tuple[Widget, bool] | None:
+    """Get a cached widget by the identifier it was resolved from.
+
+    Returns:
+        (widget, is_fresh), or None if not cached or older than the stale limit.
+    """
+    scope_entries: Any = _load_widget_cache().get(scope)
+    if not isinstance(scope_entries, dict):
+        return None
+
+    entry: Any = cast(dict[str, Any], scope_entries).get(key)
+    if not isinstance(entry, dict):
+        return None
+
+    entry_dict = cast(dict[str, Any], entry)
+    cached_at: Any = entry_dict.get("cached_at")
+    if not isinstance(cached_at, (int, float)):
+        return None
+
+    age = time.time() - cached_at
+    if age > WIDGET_STALE_SECONDS:
+        return None
+
+    try:
+        widget = Widget.model_validate(entry_dict.get("widget"))
+    except ValueError:
+        return None
+    return (widget, age <= WIDGET_FRESH_SECONDS)
+
+
+def set_cached_widget(scope: str, key: str, widget: Widget) -> None:
+    """Cache a widget under the identifier it was resolved from."""
+    with _cache_write_lock:
+        cache = _load_widget_cache()
+        if not isinstance(cache.get(scope), dict):
+            cache[scope] = {}
+        cache[scope][key] = {
+            "cached_at": time.time(),
+            "widget": widget.model_dump(by_alias=True, mode="json"),
+        }
+        _save_widget_cache(cache)
+
+
+def clear_widget_cache(scope: str) -> None:
+    """Remove all cached widgets in a scope."""
+    with _cache_write_lock:
+        cache = _load_widget_cache()
+        if scope in cache:
+            del cache[scope]
+            _save_widget_cache(cache)
+
+
+def get_cached_list(scope: str, key: str) -> list[dict[str, Any]] | None:
+    """Get a cached list of raw API entities, e.g. key "users" or "columns:<id>".
+
+    Returns:
+        The entities, or None if not cached or older than LIST_CACHE_SECONDS.
+    """
+    scope_entries: Any = _load_cache_file(get_list_cache_path()).get(scope)
+    if not isinstance(scope_entries, dict):
+        return None
+
+    entry: Any = cast(dict[str, Any], scope_entries).get(key)
+    if not isinstance(entry, dict):
+        return None
+
+    entry_dict = cast(dict[str, Any], entry)
+    cached_at: Any = entry_dict.get("cached_at")
+    items: Any = entry_dict.get("items")
+    if not isinstance(cached_at, (int, float)) or not isinstance(items, list):
+        return None
+    if time.time() - cached_at > LIST_CACHE_SECONDS:
+        return None
+    return cast(list[dict[str, Any]], items)
+
+
+def set_cached_list(
+    scope: str, key: str, items: list[dict[str, Any]]
+) -> None:
+    """Cache a list of raw API entities."""
+    with _cache_write_lock:
+        cache_path = get_list_cache_path()
+        cache = _load_cache_file(cache_path)
+        if not isinstance(cache.get(scope), dict):
+            cache[scope] = {}
+        cache[scope][key] = {"cached_at": time.time(), "items": items}
+        _save_cache_file(cache_path, cache)
+
+
+def clear_list_cache(scope: str, kind: str | None = None) -> None:
+    """Remove a scope's cached lists, or only those of one kind."""
+    with _cache_write_lock:
+        cache_path = get_list_cache_path()
+        cache = _load_cache_file(cache_path)
+        scope_entries: Any = cache.get(scope)
+        if not isinstance(scope_entries, dict):
+            return
+        if kind is None:
+            del cache[scope]
+        else:
+            entries = cast(dict[str, Any], scope_entries)
+            stale = [k for k in entries if k.partition(":")[0] == kind]
+            if not stale:
+                return
+            for key in stale:
+                del entries[key]
+        _save_cache_file(cache_path, cache)
+
+
+def clear_lookup_caches() -> None:
+    """Remove the cached boards and lists of every scope.
+
+    Cached card responses are kept, since they are revalidated on every use.
+    """
+    for cache_path in (get_widget_cache_path(), get_list_cache_path()):
+        try:
+            cache_path.unlink()
+        except OSError:
+            pass
+
+
+def clear_cache() -> None:
+    """Remove every cache file, e.g. when the user logs out."""
+    shutil.rmtree(get_cache_dir(), ignore_errors=True)
+
+
+def get_cached_cards(scope: str) -> dict[str, tuple[str, str]]:
+    """Get a scope's cached card responses.
+
+    Returns:
+        (etag, response JSON) by card ID
+    """
+    scope_entries: Any = _load_cache_file(get_card_cache_path()).get(scope)
+    if not isinstance(scope_entries, dict):
+        return {}
+
+    cards: dict[str, tuple[str, str]] = {}
+    for card_id, entry in cast(dict[str, Any], scope_entries).items():
+        if not isinstance(entry, dict):
+            continue
+        entry_dict = cast(dict[str, Any], entry)
+        etag: Any = entry_dict.get("etag")
+        body: Any = entry_dict.get("body")
+        if isinstance(etag, str) and isinstance(body, str):
+            cards[card_id] = (etag, body)
+    return cards
+
+
+def set_cached_cards(
+    scope: str, cards: Mapping[str, tuple[str, str]]
+) -> None:
+    """Cache card responses with their ETags, evicting the oldest entries.
+
+    Args:
+        scope: Account and organization the cards belong to
+        cards: (etag, response JSON) by card ID, from least to most recently
+            fetched
+    """
+    with _cache_write_lock:
+        cache_path = get_card_cache_path()
+        cache = _load_cache_file(cache_path)
+        if not isinstance(cache.get(scope), dict):
+            cache[scope] = {}
+        scope_entries = cache[scope]
+        for card_id, (etag, body) in cards.items():
+            # Re-insert so entries stay ordered from least to most recently
+            # fetched
+            scope_entries.pop(card_id, None)
+            scope_entries[card_id] = {"etag": etag, "body": body}
+        for stale_id in list(scope_entries)[:-CARD_CACHE_MAX_ENTRIES]:
+            del scope_entries[stale_id]
+        _save_cache_file(cache_path, cache)
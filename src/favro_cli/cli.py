@@ -1,25 +1,87 @@
 """Main CLI application."""
 
-from typing import Annotated, Optional
+import importlib
+from typing import Annotated, Any, Optional
 
 import typer
-from rich.console import Console
+from typer.core import TyperCommand, TyperGroup
+
+from favro_cli.commands import COMMAND_HELP
+
+# Sub-commands are only imported when invoked, so that `favro --help` and
+# `favro --version` don't pay for the API client, models and resolvers.
+# Maps command name to (module, attribute); the short help listed for each
+# is COMMAND_HELP.
+LAZY_COMMANDS: dict[str, tuple[str, str]] = {
+    "login": ("favro_cli.commands.auth", "login"),
+    "logout": ("favro_cli.commands.auth", "logout"),
+    "whoami": ("favro_cli.commands.auth", "whoami"),
+    "org": ("favro_cli.commands.org", "app"),
+    "board": ("favro_cli.commands.board", "app"),
+    "card": ("favro_cli.commands.card", "app"),
+    "column": ("favro_cli.commands.column", "app"),
+}
+
+
+class LazyGroup(TyperGroup):
+    """Typer group that imports sub-command modules on first use."""
+
+    _formatting_help = False
+
+    def list_commands(self, ctx: Any) -> list[str]:
+        return list(LAZY_COMMANDS)
+
+    def get_command(self, ctx: Any, cmd_name: str) -> Any:
+        command = self.commands.get(cmd_name)
+        if command is not None or cmd_name not in LAZY_COMMANDS:
+            return command
+
+        module_name, attr = LAZY_COMMANDS[cmd_name]
+        if self._formatting_help:
+            # Listing commands in the help page only needs the short help
+            return TyperCommand(cmd_name, help=COMMAND_HELP[cmd_name])
+
+        command = _load_command(module_name, attr, COMMAND_HELP[cmd_name])
+        command.name = cmd_name
+        self.commands[cmd_name] = command
+        return command
+
+    def format_help(self, ctx: Any, formatter: Any) -> None:
+        self._formatting_help = True
+        try:
+            super().format_help(ctx, formatter)
+        finally:
+            self._formatting_help = False
+
+
+def _load_command(module_name: str, attr: str, help_text: str) -> Any:
+    """Import a command module and build the Click command for it."""
+    target = getattr(importlib.import_module(module_name), attr)
+    if isinstance(target, typer.Typer):
+        return typer.main.get_group(target)
+
+    # Plain functions (top-level auth commands) get a single-command app
+    wrapper = typer.Typer(add_completion=False)
+    wrapper.command(help=help_text)(target)
+    return typer.main.get_command(wrapper)
+
 
 app = typer.Typer(
     name="favro",
+    cls=LazyGroup,
     help="CLI for Favro project management",
     no_args_is_help=True,
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 
-console = Console()
-
 
 def version_callback(value: bool) -> None:
     if value:
-        from favro_cli import __version__
+        from importlib.metadata import version
 
-        console.print(f"favro-cli version {__version__}")
+        from rich.console import Console
+
+        Console().print(f"favro-cli version {version('favro-cli')}")
         raise typer.Exit()
 
 
@@ -35,25 +97,16 @@ def main(
             is_eager=True,
         ),
     ] = None,
+    refresh_cache: Annotated[
+        bool,
+        typer.Option(
+            "--refresh-cache",
+            help="Discard cached boards, columns, users and tags before running.",
+        ),
+    ] = False,
 ) -> None:
     """Favro CLI - Manage your Favro boards from the command line."""
-    pass
-
-
-def _register_commands() -> None:
-    """Register all sub-commands. Called at import time."""
-    from favro_cli.commands import auth, board, card, column, org
-
-    # Register sub-commands
-    app.add_typer(org.app, name="org")
-    app.add_typer(board.app, name="board")
-    app.add_typer(card.app, name="card")
-    app.add_typer(column.app, name="column")
-
-    # Register top-level auth commands
-    app.command()(auth.login)
-    app.command()(auth.logout)
-    app.command()(auth.whoami)
-
+    if refresh_cache:
+        from favro_cli.cache import clear_lookup_caches
 
-_register_commands()
+        clear_lookup_caches()
@@ -1 +1,35 @@
 """CLI commands."""
+
+import importlib
+from types import ModuleType
+
+# Command modules are loaded on first attribute access (PEP 562), so that
+# `from favro_cli.commands import org` doesn't import the board and card
+# commands and their dependencies as well.
+_MODULES = {
+    "auth": "favro_cli.commands.auth",
+    "board": "favro_cli.commands.board",
+    "card": "favro_cli.commands.card",
+    "column": "favro_cli.commands.column",
+    "common": "favro_cli.commands.common",
+    "org": "favro_cli.commands.org",
+}
+
+# Short help for each top-level command, shared by the command modules and
+# the root group, which lists commands without importing their modules
+COMMAND_HELP = {
+    "login": "Login to Favro by saving credentials.",
+    "logout": "Remove saved credentials.",
+    "whoami": "Show current user information.",
+    "org": "Organization commands",
+    "board": "Board commands",
+    "card": "Card commands",
+    "column": "Column commands",
+}
+
+
+def __getattr__(name: str) -> ModuleType:
+    if name not in _MODULES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return importlib.import_module(_MODULES[name])
+
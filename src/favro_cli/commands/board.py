@@ -1,32 +1,76 @@
 """Board (widget) commands."""
 
-from typing import Annotated
+from collections import Counter, defaultdict
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from itertools import pairwise
+from operator import attrgetter, itemgetter
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from favro_cli.api.client import FavroAPIError, FavroAuthError
-from favro_cli.api.models import Card, Column, Tag
-from favro_cli.commands.common import get_client
+from favro_cli.commands import COMMAND_HELP
+from favro_cli.commands.common import (
+    JsonOutputOption,
+    get_client,
+    handle_api_errors,
+    require_board_id,
+    speculative_executor,
+)
 from favro_cli.config import get_board_id, set_board_id
 from favro_cli.output.formatters import (
+    get_console,
     output_error,
+    output_info,
     output_json,
     output_panel,
     output_success,
     output_table,
 )
-from favro_cli.resolvers import BoardResolver, ResolverError
+
+if TYPE_CHECKING:
+    from favro_cli.api.models import Card, Column
+
+MAX_CELL_NAME_LENGTH = 200
+_NO_BOARD_MESSAGE = (
+    "No board specified and no default set. Run 'favro board select <id>' first."
+)
+_tag_markup = "[{c}]{n}[/{c}]".format
+
+# (attribute, header) specs for table and panel output
+_BOARD_TABLE_COLUMNS = (
+    ("widget_common_id", "ID"),
+    ("name", "Name"),
+    ("color", "Color"),
+    ("type", "Type"),
+)
+_BOARD_PANEL_FIELDS = (
+    ("widget_common_id", "ID"),
+    ("name", "Name"),
+    ("type", "Type"),
+    ("color", "Color"),
+)
+_COLUMN_TABLE_COLUMNS = (
+    ("column_id", "Column ID"),
+    ("name", "Name"),
+    ("card_count", "Cards"),
+    ("position", "Position"),
+)
+
+# Board argument for commands that fall back to the selected board
+DefaultBoardArgument = Annotated[
+    str | None,
+    typer.Argument(help="Board ID or name (uses default if not specified)"),
+]
 
 app = typer.Typer(
-    help="Board commands",
+    help=COMMAND_HELP["board"],
     context_settings={"help_option_names": ["-h", "--help"]},
 )
-console = Console()
 
 
 @app.command("list")
+@handle_api_errors
 def list_boards(
     collection_id: Annotated[
         str | None,
@@ -36,117 +80,71 @@ def list_boards(
         bool,
         typer.Option("--archived", "-a", help="Include archived boards"),
     ] = False,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """List all boards in the organization."""
-    try:
-        with get_client() as client:
-            widgets = client.get_widgets(collection_id=collection_id, archived=archived)
+    with get_client() as client:
+        widgets = client.get_widgets(collection_id=collection_id, archived=archived)
 
-            # Filter to only show boards (not backlogs)
-            boards = [w for w in widgets if w.type == "board"]
+        # Filter to only show boards (not backlogs)
+        boards = [w for w in widgets if w.type == "board"]
 
-            if json_output:
-                output_json(boards)
-            else:
-                output_table(
-                    boards,
-                    [
-                        ("widget_common_id", "ID"),
-                        ("name", "Name"),
-                        ("color", "Color"),
-                        ("type", "Type"),
-                    ],
-                    title="Boards",
-                )
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+        if json_output:
+            output_json(boards)
+        else:
+            output_table(boards, _BOARD_TABLE_COLUMNS, title="Boards")
 
 
 @app.command()
+@handle_api_errors
 def show(
-    board_id: Annotated[
-        str | None,
-        typer.Argument(help="Board ID or name (uses default if not specified)"),
-    ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    board_id: DefaultBoardArgument = None,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Show board details with columns and card counts."""
-    # Use default board if not specified
-    effective_board_id = board_id or get_board_id()
-
-    if not effective_board_id:
-        output_error(
-            "No board specified and no default set. Run 'favro board select <id>' first."
-        )
-        raise typer.Exit(1)
-
-    try:
-        with get_client() as client:
-            resolver = BoardResolver(client)
+    effective_board_id = require_board_id(board_id, _NO_BOARD_MESSAGE)
+
+    from favro_cli.resolvers import BoardResolver, looks_like_id
+
+    with get_client() as client:
+        resolver = BoardResolver(client)
+        columns: list["Column"] | None = None
+        if looks_like_id(effective_board_id):
+            # Most likely already a board ID: fetch its columns while the
+            # board resolves, and discard them if it resolves to another ID
+            with speculative_executor(max_workers=1) as executor:
+                columns_future = executor.submit(
+                    client.get_columns, effective_board_id, remember=False
+                )
+                widget = resolver.resolve(effective_board_id)
+                if widget.widget_common_id == effective_board_id:
+                    columns = columns_future.result()
+        else:
             widget = resolver.resolve(effective_board_id)
+        if columns is None:
             columns = client.get_columns(widget.widget_common_id)
-            columns = sorted(columns, key=lambda c: c.position)
-
-            if json_output:
-                output_json(
-                    {
-                        "board": widget.model_dump(by_alias=True),
-                        "columns": [c.model_dump(by_alias=True) for c in columns],
-                    }
-                )
-            else:
-                # Show board info
-                output_panel(
-                    widget,
-                    [
-                        ("widget_common_id", "ID"),
-                        ("name", "Name"),
-                        ("type", "Type"),
-                        ("color", "Color"),
-                    ],
-                    title=f"Board: {widget.name}",
-                )
+        columns = _sort_columns(columns)
+
+        if json_output:
+            output_json(
+                {
+                    "board": widget,
+                    "columns": columns,
+                }
+            )
+        else:
+            # Show board info
+            output_panel(widget, _BOARD_PANEL_FIELDS, title=f"Board: {widget.name}")
 
-                # Show columns
-                console.print()
-                output_table(
-                    columns,
-                    [
-                        ("column_id", "Column ID"),
-                        ("name", "Name"),
-                        ("card_count", "Cards"),
-                        ("position", "Position"),
-                    ],
-                    title="Columns",
-                )
-    except ResolverError as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+            # Show columns
+            output_info("")
+            output_table(columns, _COLUMN_TABLE_COLUMNS, title="Columns")
 
 
 @app.command()
+@handle_api_errors
 def view(
-    board_id: Annotated[
-        str | None,
-        typer.Argument(help="Board ID or name (uses default if not specified)"),
-    ] = None,
+    board_id: DefaultBoardArgument = None,
     max_cards: Annotated[
         int,
         typer.Option("--max-cards", "-m", help="Max cards to show per column"),
@@ -155,55 +153,53 @@ def view(
         bool,
         typer.Option("--all", "-a", help="Show all cards (no limit)"),
     ] = False,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """View board with cards in a Kanban-style layout."""
-    # Use default board if not specified
-    effective_board_id = board_id or get_board_id()
-
-    if not effective_board_id:
-        output_error(
-            "No board specified and no default set. Run 'favro board select <id>' first."
-        )
-        raise typer.Exit(1)
+    effective_board_id = require_board_id(board_id, _NO_BOARD_MESSAGE)
 
     if show_all:
         max_cards = 10000
-    try:
-        with get_client() as client:
-            resolver = BoardResolver(client)
-            widget = resolver.resolve(effective_board_id)
-            columns = client.get_columns(widget.widget_common_id)
-            cards = client.get_cards(widget_common_id=widget.widget_common_id)
-            tags = client.get_tags()
-            tags_map = {t.tag_id: t for t in tags}
+    from favro_cli.resolvers import BoardResolver
+
+    with get_client() as client:
+        resolver = BoardResolver(client)
+        widget = resolver.resolve(effective_board_id)
+
+        # Columns and tags are independent of the cards, so fetch them
+        # concurrently while the cards are read
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            columns_future = executor.submit(client.get_columns, widget.widget_common_id)
+            cards = client.iter_cards(widget_common_id=widget.widget_common_id)
 
             if json_output:
                 output_json(
                     {
-                        "board": widget.model_dump(by_alias=True),
-                        "columns": [c.model_dump(by_alias=True) for c in columns],
-                        "cards": [c.model_dump(by_alias=True) for c in cards],
+                        "board": widget,
+                        "columns": columns_future.result(),
+                        "cards": list(cards),
                     }
                 )
-            else:
-                _render_board_view(widget.name, columns, cards, max_cards, tags_map)
-
-    except ResolverError as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+                return
+
+            # Tags are only shown in the rendered view
+            tags_future = executor.submit(client.get_tags)
+            cards_by_column, card_counts = _group_cards(cards, max_cards)
+            columns = columns_future.result()
+            tags = tags_future.result()
+
+        # Tag markup is shared by many cards, so format each tag once
+        tag_markup = {
+            t.tag_id: _tag_markup(c=t.color, n=t.name) if t.color else t.name
+            for t in tags
+        }
+        _render_board_view(
+            widget.name, columns, cards_by_column, card_counts, max_cards, tag_markup
+        )
 
 
 @app.command()
+@handle_api_errors
 def select(
     board_id: Annotated[
         str,
@@ -211,29 +207,23 @@ def select(
     ],
 ) -> None:
     """Select a board as default."""
-    try:
-        with get_client() as client:
-            resolver = BoardResolver(client)
-            board = resolver.resolve(board_id)
-            set_board_id(board.widget_common_id)
-            output_success(f"Selected board: {board.name}")
-    except ResolverError as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+    from favro_cli.cache import clear_widget_cache
+    from favro_cli.resolvers import BoardResolver
+
+    with get_client() as client:
+        # Always resolve against the API when selecting, refreshing the cache
+        if client.cache_scope:
+            clear_widget_cache(client.cache_scope)
+        resolver = BoardResolver(client)
+        board = resolver.resolve(board_id)
+        set_board_id(board.widget_common_id, board.name)
+        output_success(f"Selected board: {board.name}")
 
 
 @app.command()
+@handle_api_errors
 def current(
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Show the currently selected board."""
     board_id = get_board_id()
@@ -241,90 +231,113 @@ def current(
         output_error("No board selected. Run 'favro board select <id>' first.")
         raise typer.Exit(1)
 
-    try:
-        with get_client() as client:
-            resolver = BoardResolver(client)
-            board = resolver.resolve(board_id)
+    from favro_cli.resolvers import BoardResolver
 
-            if json_output:
-                output_json(board)
-            else:
-                output_success(
-                    f"Current board: {board.name} ({board.widget_common_id})"
-                )
-    except ResolverError as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+    with get_client() as client:
+        resolver = BoardResolver(client)
+        board = resolver.resolve(board_id)
+
+        if json_output:
+            output_json(board)
+        else:
+            output_success(
+                f"Current board: {board.name} ({board.widget_common_id})"
+            )
+
+
+def _sort_columns(columns: list["Column"]) -> list["Column"]:
+    """Sort columns by position, skipping the sort when already in order.
+
+    The API normally returns columns in position order.
+    """
+    if all(a.position <= b.position for a, b in pairwise(columns)):
+        return columns
+    return sorted(columns, key=attrgetter("position"))
+
+
+def _group_cards(
+    cards: Iterable["Card"], max_cards: int
+) -> tuple[dict[str, list["Card"]], Counter[str]]:
+    """Group cards by column, keeping the first max_cards of each by position.
+
+    Cards are consumed as they arrive and each column's list is trimmed as it
+    grows, so memory stays bounded by max_cards per column however large the
+    board is.
+
+    Returns:
+        (cards by column ID sorted by position, total card count per column)
+    """
+    decorated_by_column: defaultdict[str, list[tuple[float, "Card"]]] = defaultdict(list)
+    card_counts: Counter[str] = Counter()
+    keep = max(max_cards, 0)
+    trim_at = max(2 * keep, 1)
+
+    for card in cards:
+        column_id = card.column_id
+        if not column_id:
+            continue
+        card_counts[column_id] += 1
+        decorated = decorated_by_column[column_id]
+        decorated.append(
+            (card.list_position if card.list_position is not None else 0, card)
+        )
+        if len(decorated) >= trim_at:
+            # Stable sort, so ties keep arrival order as a full sort would
+            decorated.sort(key=itemgetter(0))
+            del decorated[keep:]
+
+    cards_by_column: dict[str, list["Card"]] = {}
+    for column_id, decorated in decorated_by_column.items():
+        decorated.sort(key=itemgetter(0))
+        cards_by_column[column_id] = [c for _, c in decorated[:keep]]
+    return cards_by_column, card_counts
 
 
 def _render_board_view(
     board_name: str,
-    columns: list[Column],
-    cards: list[Card],
+    columns: list["Column"],
+    cards_by_column: dict[str, list["Card"]],
+    card_counts: Counter[str],
     max_cards: int,
-    tags_map: dict[str, Tag] | None = None,
+    tag_markup: dict[str, str] | None = None,
 ) -> None:
     """Render a Kanban-style board view."""
-    # Sort columns by position
-    sorted_columns = sorted(columns, key=lambda c: c.position)
+    from rich.table import Table
 
-    # Group cards by column
-    cards_by_column: dict[str, list[Card]] = {}
-    for card in cards:
-        if card.column_id:
-            if card.column_id not in cards_by_column:
-                cards_by_column[card.column_id] = []
-            cards_by_column[card.column_id].append(card)
-
-    # Sort cards by position within each column
-    for col_id in cards_by_column:
-        cards_by_column[col_id].sort(
-            key=lambda c: c.list_position if c.list_position is not None else 0
-        )
+    # Sort columns by position
+    sorted_columns = _sort_columns(columns)
 
     # Create table
     table = Table(title=f"Board: {board_name}", show_lines=True)
 
+    # Cards per column in display order, looked up once
+    col_lists = [cards_by_column.get(col.column_id, []) for col in sorted_columns]
+    col_lens = [len(col_cards) for col_cards in col_lists]
+    col_totals = [card_counts[col.column_id] for col in sorted_columns]
+
     # Add column headers
-    for col in sorted_columns:
-        card_count = len(cards_by_column.get(col.column_id, []))
+    for col, card_count in zip(sorted_columns, col_totals):
         table.add_column(f"{col.name} ({card_count})", width=200)
 
     # Determine max rows needed
-    max_rows = (
-        max(
-            min(len(cards_by_column.get(col.column_id, [])), max_cards)
-            for col in sorted_columns
-        )
-        if sorted_columns
-        else 0
-    )
+    max_rows = max(col_lens, default=0)
 
     # Add rows
     for row_idx in range(max_rows):
-        row_cells: list[str] = []
-        for col in sorted_columns:
-            col_cards = cards_by_column.get(col.column_id, [])
-            if row_idx < len(col_cards):
-                card = col_cards[row_idx]
-                card_text = _format_card_cell(card, tags_map)
-                row_cells.append(card_text)
-            else:
-                row_cells.append("")
-        table.add_row(*row_cells)
+        table.add_row(
+            *[
+                _format_card_cell(col_cards[row_idx], tag_markup)
+                if row_idx < card_count
+                else ""
+                for col_cards, card_count in zip(col_lists, col_lens)
+            ]
+        )
 
     # Add "..." row if there are more cards
     has_more = False
     more_row: list[str] = []
-    for col in sorted_columns:
-        col_cards = cards_by_column.get(col.column_id, [])
-        remaining = len(col_cards) - max_cards
+    for card_count in col_totals:
+        remaining = card_count - max_cards
         if remaining > 0:
             has_more = True
             more_row.append(f"[dim]... +{remaining} more[/dim]")
@@ -334,39 +347,35 @@ def _render_board_view(
     if has_more:
         table.add_row(*more_row)
 
-    console.print(table)
-
+    get_console().print(table)
 
-def _format_card_cell(card: Card, tags_map: dict[str, Tag] | None = None) -> str:
-    """Format a card for display in a table cell."""
-    lines: list[str] = []
 
-    # Card identifier and name
-    lines.append(f"[bold]\\[#{card.sequential_id}][/bold] {card.name[:200]}")
+def _format_card_cell(card: "Card", tag_markup: dict[str, str] | None = None) -> str:
+    """Format a card for display in a table cell.
 
-    # Truncate name if too long
-    if len(card.name) > 200:
-        lines[0] = f"[bold]\\[#{card.sequential_id}][/bold] {card.name[:197]}..."
+    Args:
+        card: Card to format
+        tag_markup: Pre-formatted Rich markup for each tag, by tag ID
+    """
+    # Card identifier and name, truncated if too long
+    name = card.name
+    if len(name) > MAX_CELL_NAME_LENGTH:
+        name = name[: MAX_CELL_NAME_LENGTH - 3] + "..."
+    lines: list[str] = [f"[bold]\\[#{card.sequential_id}][/bold] {name}"]
 
     # Show due date if set
-    if card.due_date:
-        due_str = card.due_date.strftime("%Y-%m-%d")
-        lines.append(f"[dim]Due: {due_str}[/dim]")
+    due_date = card.due_date
+    if due_date:
+        lines.append(f"[dim]Due: {due_date.strftime('%Y-%m-%d')}[/dim]")
 
     # Show task progress if any
-    if card.tasks_total > 0:
-        lines.append(f"[dim]Tasks: {card.tasks_done}/{card.tasks_total}[/dim]")
+    tasks_total = card.tasks_total
+    if tasks_total > 0:
+        lines.append(f"[dim]Tasks: {card.tasks_done}/{tasks_total}[/dim]")
 
     # Show tags if any
-    if card.tags and tags_map:
-        tag_strs: list[str] = []
-        for tid in card.tags:
-            if tid in tags_map:
-                tag = tags_map[tid]
-                if tag.color:
-                    tag_strs.append(f"[{tag.color}]{tag.name}[/{tag.color}]")
-                else:
-                    tag_strs.append(tag.name)
+    if card.tags and tag_markup:
+        tag_strs = [tag_markup[tid] for tid in card.tags if tid in tag_markup]
         if tag_strs:
             lines.append("")
             lines.append(", ".join(tag_strs))
@@ -1,28 +1,81 @@
 """Card commands."""
 
-from typing import Annotated
+import sys
+import threading
+from collections.abc import Callable, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor
+from itertools import islice
+from typing import TYPE_CHECKING, Annotated
 
 import typer
-from rich.console import Console
-from rich.panel import Panel
 
-from favro_cli.api.client import FavroAPIError, FavroAuthError
-from favro_cli.api.models import Card
-from favro_cli.commands.common import get_client
-from favro_cli.config import get_board_id
+from favro_cli.api.errors import FavroNotFoundError
+from favro_cli.commands import COMMAND_HELP
+from favro_cli.commands.common import (
+    BoardOption,
+    ForceOption,
+    JsonOutputOption,
+    get_client,
+    handle_api_errors,
+    require_board_id,
+    retry_with_fresh_lists,
+    speculative_executor,
+)
+from favro_cli.config import get_board_id, get_board_name
 from favro_cli.output.formatters import (output_error, output_json,
-                                         output_success, output_table)
-from favro_cli.resolvers import (BoardResolver, CardResolver, ColumnResolver,
-                                 ResolverError, TagResolver, UserResolver)
+                                         output_json_items, output_success,
+                                         output_table, output_text_panel)
+from favro_cli.resolvers import looks_like_id
+
+if TYPE_CHECKING:
+    from rich.text import Text
+
+    from favro_cli.api.client import FavroClient
+    from favro_cli.api.models import Card, Column
+    from favro_cli.resolvers import BatchResult, CardResolver
+
+# Cards fetched or deleted at once by get-many and delete, matching the
+# client's connection pool
+BULK_WORKERS = 8
+
+# (attribute, header) specs for table output
+_CARD_TABLE_COLUMNS = (
+    ("sequential_id", "#"),
+    ("name", "Name"),
+    ("tasks_done", "Done"),
+    ("tasks_total", "Total"),
+)
+
+# Option and argument types shared by the card commands
+CardIdArgument = Annotated[
+    str,
+    typer.Argument(help="Card ID, sequential ID (#123), or name"),
+]
+CardIdsArgument = Annotated[
+    list[str],
+    typer.Argument(help="Card IDs, sequential IDs (#123), or names"),
+]
+BoardScopeOption = Annotated[
+    str | None,
+    typer.Option("--board", "-b", help="Board ID or name (narrows card search scope)"),
+]
+NewNameOption = Annotated[
+    str | None,
+    typer.Option("--name", "-n", help="New card name"),
+]
+NewDescriptionOption = Annotated[
+    str | None,
+    typer.Option("--description", "-d", help="New description"),
+]
 
 app = typer.Typer(
-    help="Card commands",
+    help=COMMAND_HELP["card"],
     context_settings={"help_option_names": ["-h", "--help"]},
 )
-console = Console()
 
 
 @app.command("list")
+@handle_api_errors
 def list_cards(
     board_id: Annotated[
         str | None,
@@ -40,10 +93,17 @@ def list_cards(
         str | None,
         typer.Option("--collection", help="Filter by collection ID"),
     ] = None,
-    json_output: Annotated[
+    json_output: JsonOutputOption = False,
+    raw: Annotated[
         bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
+        typer.Option(
+            "--raw", help="With --json, output cards exactly as the API returns them"
+        ),
     ] = False,
+    limit: Annotated[
+        int | None,
+        typer.Option("--limit", "-l", min=1, help="Show at most this many cards"),
+    ] = None,
 ) -> None:
     """List cards with optional filters."""
     # Use default board if not specified
@@ -56,212 +116,359 @@ def list_cards(
         )
         raise typer.Exit(1)
 
-    try:
-        with get_client() as client:
-            # Resolve board if provided
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
-
-            # Resolve column if provided (requires board for name lookup)
-            resolved_column_id: str | None = None
-            if column_id:
+    from favro_cli.resolvers import BoardResolver, ColumnResolver
+
+    with get_client() as client, ThreadPoolExecutor(max_workers=1) as executor:
+        # A column ID doesn't need the board, so look it up while the
+        # board resolves; names still need the board (see below)
+        column_future: Future["Column"] | None = None
+        if column_id and looks_like_id(column_id):
+            column_future = executor.submit(client.get_column, column_id)
+
+        # Resolve board if provided
+        resolved_board_id: str | None = None
+        if effective_board_id:
+            resolved_board_id = BoardResolver(client).resolve_id(effective_board_id)
+
+        # Resolve column if provided (requires board for name lookup)
+        resolved_column_id: str | None = None
+        if column_id:
+            column: "Column | None" = None
+            if column_future is not None:
+                try:
+                    column = column_future.result()
+                except FavroNotFoundError:
+                    pass  # Not a column ID, resolve it by name
+            if column is None:
                 column_resolver = ColumnResolver(client)
-                column = column_resolver.resolve(column_id, board_id=resolved_board_id)
-                resolved_column_id = column.column_id
+                column = column_resolver.resolve(
+                    column_id, board_id=resolved_board_id
+                )
+            resolved_column_id = column.column_id
+
+        # Filters are applied by the API. With a limit, pages are fetched
+        # only until it is reached.
+        prefetch = limit is None
+        if json_output and raw:
+            # Passed through without validating into models and back
+            output_json_items(
+                islice(
+                    client.iter_raw_cards(
+                        widget_common_id=resolved_board_id,
+                        column_id=resolved_column_id,
+                        collection_id=collection_id,
+                        prefetch=prefetch,
+                    ),
+                    limit,
+                )
+            )
+            return
 
-            cards = client.get_cards(
+        # Cards are streamed page by page, with the next page prefetched
+        cards = islice(
+            client.iter_cards(
                 widget_common_id=resolved_board_id,
                 column_id=resolved_column_id,
                 collection_id=collection_id,
-            )
+                prefetch=prefetch,
+            ),
+            limit,
+        )
 
-            if json_output:
-                output_json(cards)
-            else:
-                output_table(
-                    cards,
-                    [
-                        ("sequential_id", "#"),
-                        ("name", "Name"),
-                        ("tasks_done", "Done"),
-                        ("tasks_total", "Total"),
-                    ],
-                    title="Cards",
-                )
-    except (ResolverError, ValueError) as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+        if json_output:
+            output_json_items(cards)
+        else:
+            output_table(cards, _CARD_TABLE_COLUMNS, title="Cards")
 
 
 @app.command()
+@handle_api_errors
 def show(
-    card_id: Annotated[
-        str,
-        typer.Argument(help="Card ID, sequential ID (#123), or name"),
-    ],
-    board_id: Annotated[
-        str | None,
-        typer.Option("--board", "-b", help="Board ID or name (narrows search scope)"),
-    ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    card_id: CardIdArgument,
+    board_id: BoardScopeOption = None,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Show detailed card information."""
     # Use default board if not specified
     effective_board_id = board_id or get_board_id()
 
-    try:
-        with get_client() as client:
-            # Resolve board if provided
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
-
+    from favro_cli.resolvers import BoardResolver, CardResolver
+
+    with get_client() as client, speculative_executor(max_workers=2) as executor:
+        # A card ID doesn't need the board, so fetch it while the board
+        # resolves; sequential IDs and names still need the board
+        card_future: Future["Card"] | None = None
+        if looks_like_id(card_id):
+            card_future = executor.submit(client.get_card, card_id)
+
+        # Resolve board if provided. The selected board's name was saved
+        # with it, so it needn't be looked up.
+        resolved_board_id: str | None = None
+        resolved_board_name: str | None = None
+        if board_id is None and effective_board_id:
+            resolved_board_id = effective_board_id
+            resolved_board_name = get_board_name()
+        elif effective_board_id:
+            board = BoardResolver(client).resolve(effective_board_id)
+            resolved_board_id, resolved_board_name = board.widget_common_id, board.name
+        columns_future: Future[list["Column"]] | None = None
+        if resolved_board_id and not json_output:
+            # The card is most likely on this board, so its column name is
+            # fetched while the card is
+            columns_future = executor.submit(client.get_columns, resolved_board_id)
+
+        card: "Card | None" = None
+        if card_future is not None:
+            try:
+                card = card_future.result()
+            except FavroNotFoundError:
+                pass  # Not a card ID, resolve it by name
+        if card is None:
             card_resolver = CardResolver(client)
             card = card_resolver.resolve(card_id, board_id=resolved_board_id)
 
-            if json_output:
-                output_json(card)
-            else:
-                # Build lookup data for display
-                board_name: str | None = None
-                column_name: str | None = None
-                users_map: dict[str, str] = {}
-                tags_map: dict[str, str] = {}
+        if json_output:
+            output_json(card)
+        else:
+            # The board is usually the card's own, so its name is known
+            board_name: str | None = None
+            column_name: str | None = None
+            if resolved_board_id == card.widget_common_id:
+                board_name = resolved_board_name
+                if columns_future is not None:
+                    column_name = next(
+                        (
+                            c.name
+                            for c in columns_future.result()
+                            if c.column_id == card.column_id
+                        ),
+                        None,
+                    )
+            _show_card_detail(
+                client, card, board_name=board_name, column_name=column_name
+            )
 
-                if card.widget_common_id:
-                    widget = client.get_widget(card.widget_common_id)
-                    board_name = widget.name
 
-                if card.column_id:
-                    column = client.get_column(card.column_id)
-                    column_name = column.name
+@app.command("get-many")
+@handle_api_errors
+def get_many(
+    card_ids: CardIdsArgument,
+    board_id: BoardScopeOption = None,
+    json_output: JsonOutputOption = False,
+) -> None:
+    """Show several cards at once."""
+    # Use default board if not specified
+    effective_board_id = board_id or get_board_id()
 
-                if card.assignments:
-                    users = client.get_users()
-                    users_map = {u.user_id: u.name for u in users}
+    from favro_cli.resolvers import BoardResolver, CardResolver
+
+    with get_client() as client:
+        # Resolve board if provided
+        resolved_board_id: str | None = None
+        if effective_board_id:
+            resolved_board_id = BoardResolver(client).resolve_id(effective_board_id)
+
+        # Cards are fetched concurrently; map keeps them in argument order
+        card_resolver = CardResolver(client)
+        with ThreadPoolExecutor(max_workers=BULK_WORKERS) as executor:
+            cards = list(
+                executor.map(
+                    lambda c: card_resolver.resolve(c, board_id=resolved_board_id),
+                    card_ids,
+                )
+            )
 
-                if card.tags:
-                    tags = client.get_tags()
-                    tags_map = {t.tag_id: t.name for t in tags}
+        if json_output:
+            output_json(cards)
+        else:
+            output_table(cards, _CARD_TABLE_COLUMNS, title="Cards")
+
+
+def _update_card(
+    resolver: "CardResolver",
+    card_id: str,
+    board_id: str | None,
+    update: Callable[[str], "Card"],
+    card: "Card | None" = None,
+) -> "Card":
+    """Apply an update to a card identified by ID, sequential ID or name.
+
+    If the card isn't resolved yet and the identifier looks like a card ID,
+    the update is sent straight to that ID, saving the lookup request. When
+    no card has that ID, the identifier is resolved and the update retried.
+
+    Args:
+        resolver: Card resolver for the command's client
+        card_id: Card identifier as given by the user
+        board_id: Resolved board ID used for sequential ID and name lookup
+        update: Sends the update for a card ID and returns the updated card
+        card: The card, if already resolved
+    """
+    if card is None:
+        if looks_like_id(card_id):
+            try:
+                return update(card_id)
+            except FavroNotFoundError:
+                pass  # Not a card ID after all, resolve it by name
+        # Any ID lookup was just made by the update, so don't repeat it
+        card = resolver.resolve(card_id, board_id=board_id, id_lookup=False)
+    return update(card.card_id)
+
+
+def _known_board_name(board_id: str) -> str | None:
+    """Get a board's name without a request, if it is the selected board."""
+    return get_board_name() if board_id == get_board_id() else None
+
+
+def _quoted_names(names: Iterable[str]) -> str:
+    """Join names for a success message, e.g. 'Alice', 'Bob'."""
+    return ", ".join(f"'{name}'" for name in names)
+
+
+def _show_card_detail(
+    client: "FavroClient",
+    card: "Card",
+    board_name: str | None = None,
+    column_name: str | None = None,
+) -> None:
+    """Look up the names a card refers to and render its detailed view.
+
+    The lookups are independent, so they run concurrently over the client's
+    connection pool. Board and column names the caller already knows are
+    not fetched again.
+    """
+    users_map: dict[str, str] = {}
+    tags_map: dict[str, str] = {}
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        widget_future = (
+            executor.submit(client.get_widget, card.widget_common_id)
+            if card.widget_common_id and board_name is None
+            else None
+        )
+        column_future = (
+            executor.submit(client.get_column, card.column_id)
+            if card.column_id and column_name is None
+            else None
+        )
+        # Only the card's own users and tags are fetched, not the full lists
+        users_future = (
+            executor.submit(
+                client.get_users_by_ids, [a.user_id for a in card.assignments]
+            )
+            if card.assignments
+            else None
+        )
+        tags_future = (
+            executor.submit(client.get_tags_by_ids, card.tags) if card.tags else None
+        )
 
-                _render_card_detail(
-                    card,
-                    board_name=board_name,
-                    column_name=column_name,
-                    users_map=users_map,
-                    tags_map=tags_map,
-                )
-    except (ResolverError, ValueError) as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+        if widget_future is not None:
+            board_name = widget_future.result().name
+        if column_future is not None:
+            column_name = column_future.result().name
+        if users_future is not None:
+            users_map = {u.user_id: u.name for u in users_future.result()}
+        if tags_future is not None:
+            tags_map = {t.tag_id: t.name for t in tags_future.result()}
+
+    _render_card_detail(
+        card,
+        board_name=board_name,
+        column_name=column_name,
+        users_map=users_map,
+        tags_map=tags_map,
+    )
 
 
 def _render_card_detail(
-    card: Card,
+    card: "Card",
     board_name: str | None = None,
     column_name: str | None = None,
     users_map: dict[str, str] | None = None,
     tags_map: dict[str, str] | None = None,
 ) -> None:
     """Render detailed card view."""
-    # Header info
-    lines: list[str] = [
-        f"[bold]#{card.sequential_id}[/bold] {card.name}",
-        "",
-    ]
+    from rich.text import Text
 
-    # Description (right under the name)
+    # Header, with the description right under the name. Styles are applied
+    # as spans, so card text is never parsed as markup.
+    header = Text.assemble((f"#{card.sequential_id}", "bold"), f" {card.name}\n")
     if card.detailed_description:
-        lines.append(card.detailed_description)
-        lines.append("")
-
-    lines.extend(
-        [
-            f"[dim]Card ID:[/dim] {card.card_id}",
-            f"[dim]Common ID:[/dim] {card.card_common_id}",
-        ]
+        header.append(f"\n{card.detailed_description}\n")
+
+    assignments = card.assignments
+    tags = card.tags
+    # Optional fields are None when absent and dropped before joining
+    fields = (
+        header,
+        _detail_field("Card ID", card.card_id),
+        _detail_field("Common ID", card.card_common_id),
+        _detail_field("Board", _with_id(board_name, card.widget_common_id))
+        if card.widget_common_id
+        else None,
+        _detail_field("Column", _with_id(column_name, card.column_id))
+        if card.column_id
+        else None,
+        _detail_field("Start", card.start_date.strftime("%Y-%m-%d"))
+        if card.start_date
+        else None,
+        _detail_field("Due", card.due_date.strftime("%Y-%m-%d"))
+        if card.due_date
+        else None,
+        _detail_field(
+            "Assigned",
+            ", ".join(
+                _with_id(users_map.get(a.user_id, a.user_id), a.user_id)
+                if users_map
+                else a.user_id
+                for a in assignments
+            ),
+        )
+        if assignments
+        else None,
+        _detail_field(
+            "Tags",
+            ", ".join(
+                _with_id(tags_map.get(tag_id, tag_id), tag_id) if tags_map else tag_id
+                for tag_id in tags
+            ),
+        )
+        if tags
+        else None,
+        _detail_field("Tasks", f"{card.tasks_done}/{card.tasks_total}")
+        if card.tasks_total > 0
+        else None,
+        _detail_field("Comments", str(card.num_comments))
+        if card.num_comments > 0
+        else None,
+    )
+
+    output_text_panel(
+        Text("\n").join(filter(None, fields)), title=f"Card #{card.sequential_id}"
     )
 
-    if card.widget_common_id:
-        if board_name:
-            lines.append(f"[dim]Board:[/dim] {board_name} ({card.widget_common_id})")
-        else:
-            lines.append(f"[dim]Board:[/dim] {card.widget_common_id}")
-    if card.column_id:
-        if column_name:
-            lines.append(f"[dim]Column:[/dim] {column_name} ({card.column_id})")
-        else:
-            lines.append(f"[dim]Column:[/dim] {card.column_id}")
-
-    # Dates
-    if card.start_date:
-        lines.append(f"[dim]Start:[/dim] {card.start_date.strftime('%Y-%m-%d')}")
-    if card.due_date:
-        lines.append(f"[dim]Due:[/dim] {card.due_date.strftime('%Y-%m-%d')}")
-
-    # Assignments
-    if card.assignments:
-        if users_map:
-            user_strs = [
-                f"{users_map.get(a.user_id, a.user_id)} ({a.user_id})"
-                for a in card.assignments
-            ]
-        else:
-            user_strs = [a.user_id for a in card.assignments]
-        lines.append(f"[dim]Assigned:[/dim] {', '.join(user_strs)}")
-
-    # Tags
-    if card.tags:
-        if tags_map:
-            tag_strs = [
-                f"{tags_map.get(tag_id, tag_id)} ({tag_id})" for tag_id in card.tags
-            ]
-        else:
-            tag_strs = list(card.tags)
-        lines.append(f"[dim]Tags:[/dim] {', '.join(tag_strs)}")
 
-    # Tasks
-    if card.tasks_total > 0:
-        lines.append(f"[dim]Tasks:[/dim] {card.tasks_done}/{card.tasks_total}")
+def _detail_field(label: str, value: str) -> "Text":
+    """Format a 'label: value' line of the card detail, with a dim label."""
+    from rich.text import Text
 
-    # Comments
-    if card.num_comments > 0:
-        lines.append(f"[dim]Comments:[/dim] {card.num_comments}")
+    return Text.assemble((f"{label}:", "dim"), f" {value}")
 
-    panel = Panel("\n".join(lines), title=f"Card #{card.sequential_id}")
-    console.print(panel)
+
+def _with_id(name: str | None, entity_id: str) -> str:
+    """Format an entity as 'name (id)', or just the ID if the name is unknown."""
+    return f"{name} ({entity_id})" if name else entity_id
 
 
 @app.command()
+@handle_api_errors
 def create(
     name: Annotated[
         str,
         typer.Argument(help="Card name"),
     ],
-    board_id: Annotated[
-        str | None,
-        typer.Option("--board", "-b", help="Board ID or name"),
-    ] = None,
+    board_id: BoardOption = None,
     column_id: Annotated[
         str | None,
         typer.Option(
@@ -276,24 +483,21 @@ def create(
         list[str] | None,
         typer.Option("--tag", "-t", help="Tag ID or name (can be used multiple times)"),
     ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Create a new card."""
     # Use default board if not specified
     effective_board_id = board_id or get_board_id()
 
-    try:
-        with get_client() as client:
-            # Resolve board if provided
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
+    from favro_cli.resolvers import BoardResolver, ColumnResolver, TagResolver
 
+    with get_client() as client:
+        # Resolve board if provided
+        resolved_board_id: str | None = None
+        if effective_board_id:
+            resolved_board_id = BoardResolver(client).resolve_id(effective_board_id)
+
+        def create_card() -> "Card":
             # Resolve column if provided (requires board for name lookup)
             resolved_column_id: str | None = None
             if column_id:
@@ -307,7 +511,7 @@ def create(
                 tag_resolver = TagResolver(client)
                 resolved_tags = [tag_resolver.resolve(t).tag_id for t in tags]
 
-            card = client.create_card(
+            return client.create_card(
                 name=name,
                 widget_common_id=resolved_board_id,
                 column_id=resolved_column_id,
@@ -315,43 +519,22 @@ def create(
                 tags=resolved_tags,
             )
 
-            if json_output:
-                output_json(card)
-            else:
-                output_success(f"Created card #{card.sequential_id}: {card.name}")
-    except (ResolverError, ValueError) as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+        card = retry_with_fresh_lists(client, create_card)
+
+        if json_output:
+            output_json(card)
+        else:
+            output_success(f"Created card #{card.sequential_id}: {card.name}")
 
 
 @app.command()
+@handle_api_errors
 def update(
-    card_id: Annotated[
-        str,
-        typer.Argument(help="Card ID, sequential ID (#123), or name"),
-    ],
-    name: Annotated[
-        str | None,
-        typer.Option("--name", "-n", help="New card name"),
-    ] = None,
-    description: Annotated[
-        str | None,
-        typer.Option("--description", "-d", help="New description"),
-    ] = None,
-    board_id: Annotated[
-        str | None,
-        typer.Option("--board", "-b", help="Board ID or name (narrows search scope)"),
-    ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    card_id: CardIdArgument,
+    name: NewNameOption = None,
+    description: NewDescriptionOption = None,
+    board_id: BoardScopeOption = None,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Update a card's properties."""
     if name is None and description is None:
@@ -361,342 +544,471 @@ def update(
     # Use default board if not specified
     effective_board_id = board_id or get_board_id()
 
-    try:
-        with get_client() as client:
-            # Resolve board if provided
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
+    from favro_cli.resolvers import BoardResolver, CardResolver
 
-            card_resolver = CardResolver(client)
-            card = card_resolver.resolve(card_id, board_id=resolved_board_id)
+    with get_client() as client:
+        # Resolve board if provided
+        resolved_board_id: str | None = None
+        if effective_board_id:
+            resolved_board_id = BoardResolver(client).resolve_id(effective_board_id)
 
-            card = client.update_card(
-                card_id=card.card_id,
+        card = _update_card(
+            CardResolver(client),
+            card_id,
+            resolved_board_id,
+            lambda target_id: client.update_card(
+                card_id=target_id,
                 name=name,
                 detailed_description=description,
-            )
+            ),
+        )
 
-            if json_output:
-                output_json(card)
-            else:
-                output_success(f"Updated card #{card.sequential_id}: {card.name}")
-    except (ResolverError, ValueError) as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+        if json_output:
+            output_json(card)
+        else:
+            output_success(f"Updated card #{card.sequential_id}: {card.name}")
 
 
 @app.command()
+@handle_api_errors
 def move(
-    card_id: Annotated[
-        str,
-        typer.Argument(help="Card ID, sequential ID (#123), or name"),
-    ],
+    card_id: CardIdArgument,
     column_id: Annotated[
-        str,
-        typer.Option("--column", "-c", help="Target column ID or name", prompt=True),
-    ],
-    board_id: Annotated[
         str | None,
-        typer.Option("--board", "-b", help="Board ID or name"),
+        typer.Option(
+            "--column", "-c", help="Target column ID or name (prompted if omitted)"
+        ),
     ] = None,
-    json_output: Annotated[
+    board_id: BoardOption = None,
+    verify: Annotated[
         bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
+        typer.Option("--verify", help="Show the moved card's details"),
     ] = False,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Move a card to a different column."""
-    # Use default board if not specified
-    effective_board_id = board_id or get_board_id()
-
-    if not effective_board_id:
-        output_error(
-            "Board is required. Use --board or set a default with 'favro board select <id>'."
-        )
-        raise typer.Exit(1)
-
-    try:
-        with get_client() as client:
-            # Resolve board
-            board_resolver = BoardResolver(client)
-            board = board_resolver.resolve(effective_board_id)
-            resolved_board_id = board.widget_common_id
-
-            # Resolve card
-            card_resolver = CardResolver(client)
-            card = card_resolver.resolve(card_id, board_id=resolved_board_id)
+    effective_board_id = require_board_id(board_id)
+
+    from favro_cli.resolvers import BatchResolver
+
+    with get_client() as client:
+        if column_id is None:
+            # Connect while the user types, so the first request doesn't
+            # wait for the TLS handshake
+            threading.Thread(target=client.warmup, daemon=True).start()
+            column_id = typer.prompt("Column id")
+
+        resolver = BatchResolver(client)
+
+        def move_card() -> tuple[str, "Column", "Card"]:
+            # Card and column are independent, so resolve them concurrently
+            resolved = resolver.resolve(
+                board=effective_board_id,
+                card=card_id,
+                column=column_id,
+                skip_card_ids=True,
+            )
+            resolved_board_id, column = resolved.board_id, resolved.column
+            assert resolved_board_id is not None and column is not None  # Both given
+
+            card = _update_card(
+                resolver.card_resolver,
+                card_id,
+                resolved_board_id,
+                lambda target_id: client.update_card(
+                    card_id=target_id,
+                    column_id=column.column_id,
+                    widget_common_id=resolved_board_id,
+                    list_position=0,
+                ),
+                card=resolved.card,
+            )
+            return resolved_board_id, column, card
 
-            # Resolve column
-            column_resolver = ColumnResolver(client)
-            column = column_resolver.resolve(column_id, board_id=resolved_board_id)
+        resolved_board_id, column, card = retry_with_fresh_lists(client, move_card)
 
-            card = client.update_card(
-                card_id=card.card_id,
-                column_id=column.column_id,
-                widget_common_id=resolved_board_id,
-                list_position=0,
+        if json_output:
+            output_json(card)
+        else:
+            output_success(
+                f"Moved card #{card.sequential_id} to column '{column.name}'"
             )
-
-            if json_output:
-                output_json(card)
-            else:
-                output_success(
-                    f"Moved card #{card.sequential_id} to column '{column.name}'"
+            if verify:
+                # The update returns the moved card, so it needn't be fetched
+                _show_card_detail(
+                    client,
+                    card,
+                    board_name=_known_board_name(resolved_board_id),
+                    column_name=column.name,
                 )
-    except (ResolverError, ValueError) as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
 
 
 @app.command()
+@handle_api_errors
 def assign(
-    card_id: Annotated[
-        str,
-        typer.Argument(help="Card ID, sequential ID (#123), or name"),
-    ],
-    user_id: Annotated[
-        str | None,
-        typer.Option("--add", "-a", help="User ID, name, or email to assign"),
-    ] = None,
-    remove_user_id: Annotated[
-        str | None,
-        typer.Option("--remove", "-r", help="User ID, name, or email to unassign"),
+    card_id: CardIdArgument,
+    user_ids: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--add",
+            "-a",
+            help="User ID, name, or email to assign (can be used multiple times)",
+        ),
     ] = None,
-    board_id: Annotated[
-        str | None,
+    remove_user_ids: Annotated[
+        list[str] | None,
         typer.Option(
-            "--board", "-b", help="Board ID or name (narrows card search scope)"
+            "--remove",
+            "-r",
+            help="User ID, name, or email to unassign (can be used multiple times)",
         ),
     ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    board_id: BoardScopeOption = None,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Assign or unassign users to a card."""
-    if user_id is None and remove_user_id is None:
+    if not user_ids and not remove_user_ids:
         output_error("Either --add or --remove must be provided")
         raise typer.Exit(1)
 
     # Use default board if not specified
     effective_board_id = board_id or get_board_id()
 
-    try:
-        with get_client() as client:
-            # Resolve board if provided
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
+    from favro_cli.resolvers import BatchResolver
 
-            # Resolve card
-            card_resolver = CardResolver(client)
-            card = card_resolver.resolve(card_id, board_id=resolved_board_id)
+    with get_client() as client:
+        resolver = BatchResolver(client)
 
-            # Resolve users
-            user_resolver = UserResolver(client)
-            add_list: list[str] | None = None
-            remove_list: list[str] | None = None
-            add_user_name: str | None = None
-            remove_user_name: str | None = None
-
-            if user_id:
-                resolved_user = user_resolver.resolve(user_id)
-                add_list = [resolved_user.user_id]
-                add_user_name = resolved_user.name
-
-            if remove_user_id:
-                resolved_user = user_resolver.resolve(remove_user_id)
-                remove_list = [resolved_user.user_id]
-                remove_user_name = resolved_user.name
-
-            card = client.update_card(
-                card_id=card.card_id,
-                add_assignments=add_list,
-                remove_assignments=remove_list,
+        def assign_users() -> tuple["BatchResult", "Card"]:
+            # Users are resolved while the board is, then the card
+            resolved = resolver.resolve(
+                board=effective_board_id,
+                card=card_id,
+                add_users=user_ids or (),
+                remove_users=remove_user_ids or (),
+                skip_card_ids=True,
             )
 
-            if json_output:
-                output_json(card)
-            else:
-                if add_user_name:
-                    output_success(
-                        f"Assigned '{add_user_name}' to card #{card.sequential_id}"
-                    )
-                if remove_user_name:
-                    output_success(
-                        f"Unassigned '{remove_user_name}' from card #{card.sequential_id}"
-                    )
-    except (ResolverError, ValueError) as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+            # All assignment changes go in a single update
+            add_list = [u.user_id for u in resolved.add_users] or None
+            remove_list = [u.user_id for u in resolved.remove_users] or None
+            card = _update_card(
+                resolver.card_resolver,
+                card_id,
+                resolved.board_id,
+                lambda target_id: client.update_card(
+                    card_id=target_id,
+                    add_assignments=add_list,
+                    remove_assignments=remove_list,
+                ),
+                card=resolved.card,
+            )
+            return resolved, card
+
+        resolved, card = retry_with_fresh_lists(client, assign_users)
+        added_users, removed_users = resolved.add_users, resolved.remove_users
+
+        if json_output:
+            output_json(card)
+        else:
+            if added_users:
+                names = _quoted_names(u.name for u in added_users)
+                output_success(f"Assigned {names} to card #{card.sequential_id}")
+            if removed_users:
+                names = _quoted_names(u.name for u in removed_users)
+                output_success(f"Unassigned {names} from card #{card.sequential_id}")
 
 
 @app.command()
+@handle_api_errors
 def tag(
-    card_id: Annotated[
-        str,
-        typer.Argument(help="Card ID, sequential ID (#123), or name"),
-    ],
-    add_tag: Annotated[
-        str | None,
-        typer.Option("--add", "-a", help="Tag ID or name to add"),
-    ] = None,
-    remove_tag: Annotated[
-        str | None,
-        typer.Option("--remove", "-r", help="Tag ID or name to remove"),
+    card_id: CardIdArgument,
+    add_tags: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--add", "-a", help="Tag ID or name to add (can be used multiple times)"
+        ),
     ] = None,
-    board_id: Annotated[
-        str | None,
+    remove_tags: Annotated[
+        list[str] | None,
         typer.Option(
-            "--board", "-b", help="Board ID or name (narrows card search scope)"
+            "--remove",
+            "-r",
+            help="Tag ID or name to remove (can be used multiple times)",
         ),
     ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    board_id: BoardScopeOption = None,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Add or remove tags from a card."""
-    if add_tag is None and remove_tag is None:
+    if not add_tags and not remove_tags:
         output_error("Either --add or --remove must be provided")
         raise typer.Exit(1)
 
     # Use default board if not specified
     effective_board_id = board_id or get_board_id()
 
-    try:
-        with get_client() as client:
-            # Resolve board if provided
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
+    from favro_cli.resolvers import BatchResolver
 
-            # Resolve card
-            card_resolver = CardResolver(client)
-            card = card_resolver.resolve(card_id, board_id=resolved_board_id)
+    with get_client() as client:
+        resolver = BatchResolver(client)
 
-            # Resolve tags
-            tag_resolver = TagResolver(client)
-            add_list: list[str] | None = None
-            remove_list: list[str] | None = None
-            add_tag_name: str | None = None
-            remove_tag_name: str | None = None
-
-            if add_tag:
-                resolved_tag = tag_resolver.resolve(add_tag)
-                add_list = [resolved_tag.tag_id]
-                add_tag_name = resolved_tag.name
-
-            if remove_tag:
-                resolved_tag = tag_resolver.resolve(remove_tag)
-                remove_list = [resolved_tag.tag_id]
-                remove_tag_name = resolved_tag.name
-
-            card = client.update_card(
-                card_id=card.card_id,
-                add_tags=add_list,
-                remove_tags=remove_list,
+        def tag_card() -> tuple["BatchResult", "Card"]:
+            # Tags are resolved while the board is, then the card
+            resolved = resolver.resolve(
+                board=effective_board_id,
+                card=card_id,
+                add_tags=add_tags or (),
+                remove_tags=remove_tags or (),
+                skip_card_ids=True,
             )
 
-            if json_output:
-                output_json(card)
-            else:
-                if add_tag_name:
-                    output_success(
-                        f"Added tag '{add_tag_name}' to card #{card.sequential_id}"
-                    )
-                if remove_tag_name:
-                    output_success(
-                        f"Removed tag '{remove_tag_name}' from card #{card.sequential_id}"
-                    )
-    except (ResolverError, ValueError) as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+            # All tag changes go in a single update
+            add_list = [t.tag_id for t in resolved.add_tags] or None
+            remove_list = [t.tag_id for t in resolved.remove_tags] or None
+            card = _update_card(
+                resolver.card_resolver,
+                card_id,
+                resolved.board_id,
+                lambda target_id: client.update_card(
+                    card_id=target_id,
+                    add_tags=add_list,
+                    remove_tags=remove_list,
+                ),
+                card=resolved.card,
+            )
+            return resolved, card
+
+        resolved, card = retry_with_fresh_lists(client, tag_card)
+        added_tags, removed_tags = resolved.add_tags, resolved.remove_tags
+
+        if json_output:
+            output_json(card)
+        else:
+            if added_tags:
+                names = _quoted_names(t.name for t in added_tags)
+                label = "tag" if len(added_tags) == 1 else "tags"
+                output_success(f"Added {label} {names} to card #{card.sequential_id}")
+            if removed_tags:
+                names = _quoted_names(t.name for t in removed_tags)
+                label = "tag" if len(removed_tags) == 1 else "tags"
+                output_success(
+                    f"Removed {label} {names} from card #{card.sequential_id}"
+                )
 
 
 @app.command()
-def delete(
-    card_id: Annotated[
-        str,
-        typer.Argument(help="Card ID, sequential ID (#123), or name"),
-    ],
-    board_id: Annotated[
+@handle_api_errors
+def edit(
+    card_id: CardIdArgument,
+    name: NewNameOption = None,
+    description: NewDescriptionOption = None,
+    column_id: Annotated[
         str | None,
+        typer.Option("--column", "-c", help="Column ID or name to move the card to"),
+    ] = None,
+    add_users: Annotated[
+        list[str] | None,
         typer.Option(
-            "--board", "-b", help="Board ID or name (narrows card search scope)"
+            "--add-user", help="User ID, name, or email to assign (repeatable)"
         ),
     ] = None,
+    remove_users: Annotated[
+        list[str] | None,
+        typer.Option(
+            "--remove-user", help="User ID, name, or email to unassign (repeatable)"
+        ),
+    ] = None,
+    add_tags: Annotated[
+        list[str] | None,
+        typer.Option("--add-tag", help="Tag ID or name to add (repeatable)"),
+    ] = None,
+    remove_tags: Annotated[
+        list[str] | None,
+        typer.Option("--remove-tag", help="Tag ID or name to remove (repeatable)"),
+    ] = None,
+    board_id: BoardScopeOption = None,
+    json_output: JsonOutputOption = False,
+) -> None:
+    """Change several card properties in a single update."""
+    changes = (column_id, add_users, remove_users, add_tags, remove_tags)
+    if name is None and description is None and not any(changes):
+        output_error("At least one change must be provided")
+        raise typer.Exit(1)
+
+    # Use default board if not specified
+    effective_board_id = board_id or get_board_id()
+
+    from favro_cli.resolvers import BatchResolver
+
+    with get_client() as client:
+        resolver = BatchResolver(client)
+
+        def edit_card() -> "Card":
+            # Users, tags and the column are resolved alongside the board and
+            # card
+            resolved = resolver.resolve(
+                board=effective_board_id,
+                card=card_id,
+                column=column_id,
+                add_users=add_users or (),
+                remove_users=remove_users or (),
+                add_tags=add_tags or (),
+                remove_tags=remove_tags or (),
+                skip_card_ids=True,
+            )
+            column = resolved.column
+
+            # Every change goes in a single update
+            return _update_card(
+                resolver.card_resolver,
+                card_id,
+                resolved.board_id,
+                lambda target_id: client.update_card(
+                    card_id=target_id,
+                    name=name,
+                    detailed_description=description,
+                    widget_common_id=column.widget_common_id if column else None,
+                    column_id=column.column_id if column else None,
+                    add_assignments=[u.user_id for u in resolved.add_users] or None,
+                    remove_assignments=(
+                        [u.user_id for u in resolved.remove_users] or None
+                    ),
+                    add_tags=[t.tag_id for t in resolved.add_tags] or None,
+                    remove_tags=[t.tag_id for t in resolved.remove_tags] or None,
+                ),
+                card=resolved.card,
+            )
+
+        card = retry_with_fresh_lists(client, edit_card)
+
+        if json_output:
+            output_json(card)
+        else:
+            output_success(f"Updated card #{card.sequential_id}: {card.name}")
+
+
+@app.command()
+@handle_api_errors
+def delete(
+    card_ids: CardIdsArgument,
+    board_id: BoardScopeOption = None,
     everywhere: Annotated[
         bool,
         typer.Option("--everywhere", "-e", help="Delete from all boards"),
     ] = False,
-    force: Annotated[
-        bool,
-        typer.Option("--force", "-f", help="Skip confirmation"),
-    ] = False,
+    force: ForceOption = False,
 ) -> None:
-    """Delete a card."""
+    """Delete one or more cards."""
+    # Nobody can answer the prompt without a terminal, so fail before any
+    # requests are made rather than block or abort on EOF
+    if not force and not sys.stdin.isatty():
+        output_error("Refusing to delete without confirmation. Use --force.")
+        raise typer.Exit(1)
+
     # Use default board if not specified
     effective_board_id = board_id or get_board_id()
 
-    try:
-        with get_client() as client:
-            # Resolve board if provided
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
-
-            # Resolve card
-            card_resolver = CardResolver(client)
-            card = card_resolver.resolve(card_id, board_id=resolved_board_id)
-
-            if not force:
-                confirm = typer.confirm(
-                    f"Are you sure you want to delete card #{card.sequential_id}: {card.name}?"
+    from favro_cli.resolvers import BoardResolver, CardResolver
+
+    with get_client() as client:
+        # Resolve board if provided
+        resolved_board_id: str | None = None
+        if effective_board_id:
+            resolved_board_id = BoardResolver(client).resolve_id(effective_board_id)
+
+        card_resolver = CardResolver(client)
+        with ThreadPoolExecutor(max_workers=BULK_WORKERS) as executor:
+            futures: list[Future[str]]
+            if force:
+                # Nothing to confirm, so cards given by ID are deleted
+                # without being looked up first
+                futures = [
+                    executor.submit(
+                        _delete_card,
+                        card_resolver,
+                        c,
+                        resolved_board_id,
+                        everywhere,
+                    )
+                    for c in card_ids
+                ]
+            else:
+                # Resolve every card before deleting any of them
+                cards = list(
+                    executor.map(
+                        lambda c: card_resolver.resolve(c, board_id=resolved_board_id),
+                        card_ids,
+                    )
                 )
-                if not confirm:
+
+                # One prompt covers all the cards
+                if len(cards) == 1:
+                    prompt = (
+                        "Are you sure you want to delete card "
+                        f"#{cards[0].sequential_id}: {cards[0].name}?"
+                    )
+                else:
+                    listing = "".join(
+                        f"  #{c.sequential_id}: {c.name}\n" for c in cards
+                    )
+                    prompt = (
+                        f"{listing}Are you sure you want to delete "
+                        f"these {len(cards)} cards?"
+                    )
+                if not typer.confirm(prompt):
                     raise typer.Abort()
 
-            client.delete_card(card.card_id, everywhere=everywhere)
-            output_success(f"Deleted card #{card.sequential_id}: {card.name}")
-    except (ResolverError, ValueError) as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+                futures = [
+                    executor.submit(
+                        _delete_card,
+                        card_resolver,
+                        card.card_id,
+                        resolved_board_id,
+                        everywhere,
+                        card=card,
+                    )
+                    for card in cards
+                ]
+
+            # Report every card that was deleted, then the first failure
+            error: Exception | None = None
+            for future in futures:
+                try:
+                    label = future.result()
+                except Exception as e:
+                    error = error or e
+                else:
+                    output_success(f"Deleted card {label}")
+            if error is not None:
+                raise error
+
+
+def _delete_card(
+    resolver: "CardResolver",
+    card_id: str,
+    board_id: str | None,
+    everywhere: bool,
+    card: "Card | None" = None,
+) -> str:
+    """Delete a card identified by ID, sequential ID or name.
+
+    As in _update_card, if the card isn't resolved yet and the identifier
+    looks like a card ID, it is deleted directly, and resolved only if no
+    card has that ID.
+
+    Returns:
+        How to refer to the deleted card in messages
+    """
+    client = resolver.client
+    if card is None:
+        if looks_like_id(card_id):
+            try:
+                client.delete_card(card_id, everywhere=everywhere)
+                return card_id
+            except FavroNotFoundError:
+                pass  # Not a card ID after all, resolve it by name
+        # Any ID lookup was just made by the delete, so don't repeat it
+        card = resolver.resolve(card_id, board_id=board_id, id_lookup=False)
+    client.delete_card(card.card_id, everywhere=everywhere)
+    return f"#{card.sequential_id}: {card.name}"
@@ -1,11 +1,22 @@
 """Column commands."""
 
-from typing import Annotated
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from operator import attrgetter
+from typing import TYPE_CHECKING, Annotated
 
 import typer
 
-from favro_cli.api.client import FavroAPIError, FavroAuthError
-from favro_cli.commands.common import get_client
+from favro_cli.commands import COMMAND_HELP
+from favro_cli.commands.common import (
+    BoardOption,
+    ForceOption,
+    JsonOutputOption,
+    get_client,
+    handle_api_errors,
+    require_board_id,
+    retry_with_fresh_lists,
+)
 from favro_cli.config import get_board_id
 from favro_cli.output.formatters import (
     output_error,
@@ -13,279 +24,237 @@ from favro_cli.output.formatters import (
     output_success,
     output_table,
 )
-from favro_cli.resolvers import BoardResolver, ColumnResolver, ResolverError
 
+if TYPE_CHECKING:
+    from favro_cli.api.models import Column
+
+# Deletes sent at once, matching the client's connection pool
+BULK_WORKERS = 8
+
+# (attribute, header) specs for table output
+_COLUMN_TABLE_COLUMNS = (
+    ("column_id", "ID"),
+    ("name", "Name"),
+    ("position", "Position"),
+    ("card_count", "Cards"),
+)
+
+# Option and argument types shared by the column commands
+ColumnIdArgument = Annotated[
+    str,
+    typer.Argument(help="Column ID or name"),
+]
+ColumnIdsArgument = Annotated[
+    list[str],
+    typer.Argument(help="Column IDs or names"),
+]
+BoardLookupOption = Annotated[
+    str | None,
+    typer.Option("--board", "-b", help="Board ID or name (required for name lookup)"),
+]
 
 app = typer.Typer(
-    help="Column commands",
+    help=COMMAND_HELP["column"],
     context_settings={"help_option_names": ["-h", "--help"]},
 )
 
 
 @app.command("list")
+@handle_api_errors
 def list_columns(
-    board_id: Annotated[
-        str | None,
-        typer.Option("--board", "-b", help="Board ID or name"),
-    ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    board_id: BoardOption = None,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """List columns for a board."""
-    # Use default board if not specified
-    effective_board_id = board_id or get_board_id()
+    effective_board_id = require_board_id(board_id)
 
-    if not effective_board_id:
-        output_error(
-            "Board is required. Use --board or set a default with 'favro board select <id>'."
-        )
-        raise typer.Exit(1)
+    from favro_cli.resolvers import BoardResolver
 
-    try:
-        with get_client() as client:
-            board_resolver = BoardResolver(client)
-            board = board_resolver.resolve(effective_board_id)
-            columns = client.get_columns(board.widget_common_id)
-
-            # Sort by position
-            columns = sorted(columns, key=lambda c: c.position)
-
-            if json_output:
-                output_json(columns)
-            else:
-                output_table(
-                    columns,
-                    [
-                        ("column_id", "ID"),
-                        ("name", "Name"),
-                        ("position", "Position"),
-                        ("card_count", "Cards"),
-                    ],
-                    title="Columns",
-                )
-    except ResolverError as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+    with get_client() as client:
+        resolved_board_id = BoardResolver(client).resolve_id(effective_board_id)
+        columns = client.get_columns(resolved_board_id)
+
+        # Sort by position. The client keeps the fetched list for reuse, so
+        # it is copied rather than sorted in place.
+        columns = sorted(columns, key=attrgetter("position"))
+
+        if json_output:
+            output_json(columns)
+        else:
+            output_table(columns, _COLUMN_TABLE_COLUMNS, title="Columns")
 
 
 @app.command()
+@handle_api_errors
 def create(
     name: Annotated[
         str,
         typer.Argument(help="Column name"),
     ],
-    board_id: Annotated[
-        str | None,
-        typer.Option("--board", "-b", help="Board ID or name"),
-    ] = None,
+    board_id: BoardOption = None,
     position: Annotated[
         int | None,
         typer.Option("--position", "-p", help="Column position (0-indexed)"),
     ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Create a new column on a board."""
-    # Use default board if not specified
-    effective_board_id = board_id or get_board_id()
+    effective_board_id = require_board_id(board_id)
 
-    if not effective_board_id:
-        output_error(
-            "Board is required. Use --board or set a default with 'favro board select <id>'."
-        )
-        raise typer.Exit(1)
+    from favro_cli.resolvers import BoardResolver
 
-    try:
-        with get_client() as client:
-            board_resolver = BoardResolver(client)
-            board = board_resolver.resolve(effective_board_id)
-            column = client.create_column(
-                widget_common_id=board.widget_common_id,
-                name=name,
-                position=position,
-            )
+    with get_client() as client:
+        resolved_board_id = BoardResolver(client).resolve_id(effective_board_id)
+        column = client.create_column(
+            widget_common_id=resolved_board_id,
+            name=name,
+            position=position,
+        )
 
-            if json_output:
-                output_json(column)
-            else:
-                output_success(f"Created column: {column.name} (position {column.position})")
-    except ResolverError as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+        if json_output:
+            output_json(column)
+        else:
+            output_success(f"Created column: {column.name} (position {column.position})")
 
 
 @app.command()
+@handle_api_errors
 def rename(
-    column_id: Annotated[
-        str,
-        typer.Argument(help="Column ID or name"),
-    ],
+    column_id: ColumnIdArgument,
     name: Annotated[
         str,
         typer.Argument(help="New column name"),
     ],
-    board_id: Annotated[
-        str | None,
-        typer.Option("--board", "-b", help="Board ID or name (required for name lookup)"),
-    ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    board_id: BoardLookupOption = None,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Rename a column."""
     # Use default board if not specified
     effective_board_id = board_id or get_board_id()
 
-    try:
-        with get_client() as client:
-            # Resolve board first if provided (needed for column name lookup)
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
-
-            column_resolver = ColumnResolver(client)
-            column = column_resolver.resolve(column_id, board_id=resolved_board_id)
-
-            column = client.update_column(
-                column_id=column.column_id,
-                name=name,
-            )
+    from favro_cli.resolvers import ColumnResolver
 
-            if json_output:
-                output_json(column)
-            else:
-                output_success(f"Renamed column to: {column.name}")
-    except ResolverError as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+    with get_client() as client:
+        column_resolver = ColumnResolver(client)
+
+        def rename_column() -> "Column":
+            # The board is only resolved if a column is looked up by name
+            column = column_resolver.resolve(column_id, board=effective_board_id)
+            return client.update_column(column_id=column.column_id, name=name)
+
+        column = retry_with_fresh_lists(client, rename_column)
+
+        if json_output:
+            output_json(column)
+        else:
+            output_success(f"Renamed column to: {column.name}")
 
 
 @app.command()
+@handle_api_errors
 def move(
-    column_id: Annotated[
-        str,
-        typer.Argument(help="Column ID or name"),
-    ],
+    column_id: ColumnIdArgument,
     position: Annotated[
         int,
         typer.Argument(help="New position (0-indexed)"),
     ],
-    board_id: Annotated[
-        str | None,
-        typer.Option("--board", "-b", help="Board ID or name (required for name lookup)"),
-    ] = None,
-    json_output: Annotated[
-        bool,
-        typer.Option("--json", "-j", help="Output in JSON format"),
-    ] = False,
+    board_id: BoardLookupOption = None,
+    json_output: JsonOutputOption = False,
 ) -> None:
     """Move a column to a different position."""
     # Use default board if not specified
     effective_board_id = board_id or get_board_id()
 
-    try:
-        with get_client() as client:
-            # Resolve board first if provided (needed for column name lookup)
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
-
-            column_resolver = ColumnResolver(client)
-            column = column_resolver.resolve(column_id, board_id=resolved_board_id)
-
-            column = client.update_column(
-                column_id=column.column_id,
-                position=position,
-            )
+    from favro_cli.resolvers import ColumnResolver
 
-            if json_output:
-                output_json(column)
-            else:
-                output_success(f"Moved column '{column.name}' to position {column.position}")
-    except ResolverError as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+    with get_client() as client:
+        column_resolver = ColumnResolver(client)
+
+        def move_column() -> "Column":
+            # The board is only resolved if a column is looked up by name
+            column = column_resolver.resolve(column_id, board=effective_board_id)
+            return client.update_column(column_id=column.column_id, position=position)
+
+        column = retry_with_fresh_lists(client, move_column)
+
+        if json_output:
+            output_json(column)
+        else:
+            output_success(f"Moved column '{column.name}' to position {column.position}")
 
 
 @app.command()
+@handle_api_errors
 def delete(
-    column_id: Annotated[
-        str,
-        typer.Argument(help="Column ID or name"),
-    ],
-    board_id: Annotated[
-        str | None,
-        typer.Option("--board", "-b", help="Board ID or name (required for name lookup)"),
-    ] = None,
-    force: Annotated[
-        bool,
-        typer.Option("--force", "-f", help="Skip confirmation"),
-    ] = False,
+    column_ids: ColumnIdsArgument,
+    board_id: BoardLookupOption = None,
+    force: ForceOption = False,
 ) -> None:
-    """Delete a column and all its cards."""
+    """Delete one or more columns and all their cards."""
+    # Nobody can answer the prompt without a terminal, so fail before any
+    # requests are made rather than block or abort on EOF
+    if not force and not sys.stdin.isatty():
+        output_error("Refusing to delete without confirmation. Use --force.")
+        raise typer.Exit(1)
+
     # Use default board if not specified
     effective_board_id = board_id or get_board_id()
 
     if not force:
-        confirm = typer.confirm(
-            "Are you sure? This will delete the column and all its cards."
-        )
-        if not confirm:
+        if len(column_ids) == 1:
+            prompt = "Are you sure? This will delete the column and all its cards."
+        else:
+            prompt = (
+                f"Are you sure? This will delete {len(column_ids)} columns "
+                "and all their cards."
+            )
+        if not typer.confirm(prompt):
             raise typer.Abort()
 
-    try:
-        with get_client() as client:
-            # Resolve board first if provided (needed for column name lookup)
-            resolved_board_id: str | None = None
-            if effective_board_id:
-                board_resolver = BoardResolver(client)
-                board = board_resolver.resolve(effective_board_id)
-                resolved_board_id = board.widget_common_id
-
-            column_resolver = ColumnResolver(client)
-            column = column_resolver.resolve(column_id, board_id=resolved_board_id)
-
-            client.delete_column(column.column_id)
-            output_success(f"Deleted column '{column.name}'")
-    except ResolverError as e:
-        output_error(str(e))
-        raise typer.Exit(1)
-    except FavroAuthError as e:
-        output_error(e.message)
-        raise typer.Exit(1)
-    except FavroAPIError as e:
-        output_error(f"API error: {e.message}")
-        raise typer.Exit(1)
+    from favro_cli.resolvers import ColumnResolver
+
+    with get_client() as client:
+        column_resolver = ColumnResolver(client)
+
+        def resolve_column(identifier: str) -> "Column":
+            # The board is only resolved if a column is looked up by name
+            return column_resolver.resolve(identifier, board=effective_board_id)
+
+        def delete_column(identifier: str, column: "Column") -> "Column":
+            # Resolved up front; resolved again if the lists it was found in
+            # turn out to be stale
+            pending = [column]
+
+            def attempt() -> "Column":
+                target = pending.pop() if pending else resolve_column(identifier)
+                client.delete_column(target.column_id)
+                return target
+
+            return retry_with_fresh_lists(client, attempt)
+
+        with ThreadPoolExecutor(max_workers=BULK_WORKERS) as executor:
+            # Resolve every column before deleting any of them. A column
+            # given twice (e.g. by ID and name) is deleted once.
+            resolved = {
+                c.column_id: (identifier, c)
+                for identifier, c in zip(
+                    column_ids, executor.map(resolve_column, column_ids)
+                )
+            }
+
+            futures: list[Future["Column"]] = [
+                executor.submit(delete_column, identifier, c)
+                for identifier, c in resolved.values()
+            ]
+
+            # Report every column that was deleted, then the first failure
+            error: Exception | None = None
+            for future in futures:
+                try:
+                    column = future.result()
+                except Exception as e:
+                    error = error or e
+                else:
+                    output_success(f"Deleted column '{column.name}'")
+            if error is not None:
+                raise error
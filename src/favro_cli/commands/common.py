@@ -1,18 +1,48 @@
 """Common utilities for command modules."""
 
+import functools
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Annotated, Callable, ParamSpec, TypeVar
+
 import typer
 
-from favro_cli.api.client import FavroClient
-from favro_cli.config import get_credentials, get_organization_id
-from favro_cli.output.formatters import output_error
+from favro_cli.api.errors import FavroAPIError, FavroAuthError, FavroNotFoundError
+from favro_cli.config import get_board_id, get_credentials, get_organization_id
+from favro_cli.resolvers.base import ResolverError
+
+if TYPE_CHECKING:
+    from concurrent.futures import ThreadPoolExecutor
+
+    from favro_cli.api.client import FavroClient
+
+P = ParamSpec("P")
+R = TypeVar("R")
 
+# Shared option types, so each command declares `json_output: JsonOutputOption = False`
+JsonOutputOption = Annotated[
+    bool,
+    typer.Option("--json", "-j", help="Output in JSON format"),
+]
+BoardOption = Annotated[
+    str | None,
+    typer.Option("--board", "-b", help="Board ID or name"),
+]
+ForceOption = Annotated[
+    bool,
+    typer.Option("--force", "-f", help="Skip confirmation"),
+]
 
-def get_client(require_org: bool = True) -> FavroClient:
+
+def get_client(require_org: bool = True) -> "FavroClient":
     """Get an authenticated client.
 
     Args:
         require_org: If True, requires organization to be selected.
     """
+    from favro_cli.api.client import FavroClient
+    from favro_cli.output.formatters import output_error
+
     creds = get_credentials()
     if creds is None:
         output_error("Not logged in. Run 'favro login' first.")
@@ -25,3 +55,87 @@ def get_client(require_org: bool = True) -> FavroClient:
 
     email, token = creds
     return FavroClient(email, token, org_id)
+
+
+MISSING_BOARD_MESSAGE = (
+    "Board is required. Use --board or set a default with 'favro board select <id>'."
+)
+
+
+def require_board_id(board_id: str | None, message: str = MISSING_BOARD_MESSAGE) -> str:
+    """Get the given board, falling back to the selected board.
+
+    Exits with the given error message if neither is set.
+    """
+    effective_board_id = board_id or get_board_id()
+    if not effective_board_id:
+        from favro_cli.output.formatters import output_error
+
+        output_error(message)
+        raise typer.Exit(1)
+    return effective_board_id
+
+
+def retry_with_fresh_lists(client: "FavroClient", attempt: Callable[[], R]) -> R:
+    """Run attempt, which resolves names and then makes a change.
+
+    Names may be resolved from lists cached on disk by an earlier command,
+    which can still hold entities deleted since. If the change comes back as
+    not found after such a list was used, the cached lists are dropped and
+    the attempt is run once more against fresh ones.
+    """
+    try:
+        return attempt()
+    except FavroNotFoundError:
+        from favro_cli.resolvers import ColumnResolver, TagResolver, UserResolver
+
+        stale = False
+        for resolver in (ColumnResolver, TagResolver, UserResolver):
+            list_kind = resolver.list_kind
+            if list_kind and client.used_cached_list(list_kind):
+                client.forget(list_kind)
+                client.forget(resolver.entity_type)
+                stale = True
+        if not stale:
+            raise
+    return attempt()
+
+
+@contextmanager
+def speculative_executor(max_workers: int) -> Iterator["ThreadPoolExecutor"]:
+    """Run requests whose results may turn out not to be needed.
+
+    On exit, pending requests are cancelled and running ones are not waited
+    for, so a discarded guess doesn't hold up the command.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    executor = ThreadPoolExecutor(max_workers=max_workers)
+    try:
+        yield executor
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def handle_api_errors(func: Callable[P, R]) -> Callable[P, R]:
+    """Report resolver and API errors and exit with status 1.
+
+    The error classes come from lightweight modules, so decorating a
+    command doesn't pull in the API client at import time.
+    """
+
+    @functools.wraps(func)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        from favro_cli.output.formatters import output_error
+
+        try:
+            return func(*args, **kwargs)
+        except (ResolverError, ValueError) as e:
+            output_error(str(e))
+        except FavroAuthError as e:
+            output_error(e.message)
+        except FavroAPIError as e:
+            output_error(f"API error: {e.message}")
+        raise typer.Exit(1)
+
+    return wrapper
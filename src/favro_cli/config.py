@@ -1,6 +1,11 @@
 """Configuration file management for Favro CLI."""
 
+import contextlib
+import functools
+import json
 import os
+import stat
+import tempfile
 import tomllib
 from pathlib import Path
 from typing import Any, TypedDict, cast
@@ -14,6 +19,7 @@ class AuthConfig(TypedDict, total=False):
 class DefaultsConfig(TypedDict, total=False):
     organization_id: str
     board_id: str
+    board_name: str
 
 
 class Config(TypedDict, total=False):
@@ -71,6 +77,9 @@ def load_config() -> Config:
         board_id_val: Any = defaults_dict.get("board_id")
         if board_id_val is not None:
             defaults["board_id"] = str(board_id_val)
+        board_name_val: Any = defaults_dict.get("board_name")
+        if board_name_val is not None:
+            defaults["board_name"] = str(board_name_val)
         if defaults:
             config["defaults"] = defaults
 
@@ -102,15 +111,60 @@ def save_config(config: Config) -> None:
             lines.append(f'organization_id = "{defaults["organization_id"]}"')
         if "board_id" in defaults:
             lines.append(f'board_id = "{defaults["board_id"]}"')
+        if "board_name" in defaults:
+            # Names are user text, so quote and escape them (JSON strings
+            # are valid TOML basic strings)
+            lines.append(f"board_name = {json.dumps(defaults['board_name'])}")
         lines.append("")
 
+    # Written to a temporary file and renamed over the config, so a reader
+    # never sees a partly written file. The file holds the API token:
+    # mkstemp creates it readable only by the owner, and an existing
+    # config keeps its permissions.
     content = "\n".join(lines)
-    config_path.write_text(content)
-
-
+    fd, tmp_name = tempfile.mkstemp(dir=config_dir, prefix="config.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        try:
+            os.chmod(tmp_name, stat.S_IMODE(config_path.stat().st_mode))
+        except FileNotFoundError:
+            pass
+        os.replace(tmp_name, config_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_name)
+        raise
+    _clear_lookup_caches()
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached() -> Config:
+    """Load configuration once for the config lookups below.
+
+    The getters share this parse, so a command reading credentials,
+    organization and board reads and parses the file only once. Callers must
+    not modify the result; setters use load_config for a fresh copy.
+    """
+    return load_config()
+
+
+def _clear_lookup_caches() -> None:
+    """Invalidate the memoized config lookups after the config file changes."""
+    _load_config_cached.cache_clear()
+    get_credentials.cache_clear()
+    get_organization_id.cache_clear()
+    get_board_id.cache_clear()
+    get_board_name.cache_clear()
+
+
+@functools.lru_cache(maxsize=1)
 def get_credentials() -> tuple[str, str] | None:
-    """Get credentials from config. Returns (email, token) or None if not configured."""
-    config = load_config()
+    """Get credentials from config. Returns (email, token) or None if not configured.
+
+    Lookups are memoized for the process lifetime and invalidated by save_config.
+    """
+    config = _load_config_cached()
     auth = config.get("auth", {})
     email = auth.get("email")
     token = auth.get("token")
@@ -120,9 +174,10 @@ def get_credentials() -> tuple[str, str] | None:
     return None
 
 
+@functools.lru_cache(maxsize=1)
 def get_organization_id() -> str | None:
     """Get default organization ID from config."""
-    config = load_config()
+    config = _load_config_cached()
     defaults = config.get("defaults", {})
     return defaults.get("organization_id")
 
@@ -136,6 +191,8 @@ def set_credentials(email: str, token: str) -> None:
 
 def set_organization_id(organization_id: str) -> None:
     """Save default organization ID to config."""
+    if organization_id == get_organization_id():
+        return  # Already selected, nothing to write
     config = load_config()
     if "defaults" not in config:
         config["defaults"] = {}
@@ -143,19 +200,34 @@ def set_organization_id(organization_id: str) -> None:
     save_config(config)
 
 
+@functools.lru_cache(maxsize=1)
 def get_board_id() -> str | None:
     """Get default board ID from config."""
-    config = load_config()
+    config = _load_config_cached()
     defaults = config.get("defaults", {})
     return defaults.get("board_id")
 
 
-def set_board_id(board_id: str) -> None:
-    """Save default board ID to config."""
+@functools.lru_cache(maxsize=1)
+def get_board_name() -> str | None:
+    """Get the default board's name, as saved when it was selected."""
+    config = _load_config_cached()
+    defaults = config.get("defaults", {})
+    return defaults.get("board_name")
+
+
+def set_board_id(board_id: str, board_name: str | None = None) -> None:
+    """Save default board ID (and its name, if known) to config."""
+    if board_id == get_board_id() and board_name == get_board_name():
+        return  # Already selected, nothing to write
     config = load_config()
     if "defaults" not in config:
         config["defaults"] = {}
     config["defaults"]["board_id"] = board_id
+    if board_name is not None:
+        config["defaults"]["board_name"] = board_name
+    else:
+        config["defaults"].pop("board_name", None)
     save_config(config)
 
 
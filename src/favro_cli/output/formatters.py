@@ -1,69 +1,127 @@
 """Output formatters for CLI output."""
 
-import json
-from typing import Any, Sequence
+import functools
+import os
+import sys
+from typing import TYPE_CHECKING, Any, Iterable, Mapping, Sequence, TextIO
 
-from pydantic import BaseModel
-from rich.console import Console
-from rich.panel import Panel
-from rich.table import Table
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+    from rich.console import Console, RenderableType
 
-console = Console()
-error_console = Console(stderr=True)
+# Streamed JSON output is flushed to stdout in chunks of about this size
+JSON_WRITE_BATCH_BYTES = 64 * 1024
 
+# ANSI colors for the fixed-format message helpers
+_RED = "\x1b[31m"
+_GREEN = "\x1b[32m"
+_YELLOW = "\x1b[33m"
+_RESET = "\x1b[0m"
 
-def output_json(data: BaseModel | Sequence[BaseModel] | dict[str, Any]) -> None:
-    """Output data as JSON."""
-    if isinstance(data, BaseModel):
-        json_data = data.model_dump(by_alias=True)
-    elif isinstance(data, dict):
-        json_data = data
-    else:
-        # It's a sequence
-        json_data = [item.model_dump(by_alias=True) for item in data]
-    # Use print() instead of console.print() to avoid Rich word-wrapping
-    print(json.dumps(json_data, indent=2, default=str))
+
+@functools.cache
+def get_console() -> "Console":
+    """Get the stdout console, importing Rich on first use.
+
+    JSON output and --help never print through Rich, so they don't pay for
+    importing it.
+    """
+    from rich.console import Console
+
+    return Console()
+
+
+def _write_stdout(payload: bytes) -> None:
+    """Write encoded output to stdout.
+
+    Writes the bytes directly rather than through console.print() (which
+    word-wraps) or print() (which would decode and re-encode).
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        sys.stdout.write(payload.decode())
+        return
+    sys.stdout.flush()
+    buffer.write(payload)
+    buffer.flush()
+
+
+def output_json(data: "BaseModel | Sequence[BaseModel] | Mapping[str, Any]") -> None:
+    """Output data as JSON.
+
+    Serialized by pydantic-core, so models (including models nested in dicts
+    and lists) are written by alias without building intermediate dicts.
+    """
+    from pydantic_core import to_json
+
+    _write_stdout(to_json(data, indent=2, by_alias=True) + b"\n")
+
+
+def output_json_items(items: Iterable["BaseModel | Mapping[str, Any]"]) -> None:
+    """Output models or JSON objects as a JSON array, writing each as it arrives.
+
+    Produces the same text as output_json(list(items)) without holding the
+    whole list, so output starts before a paginated fetch has finished.
+    """
+    from pydantic_core import to_json
+
+    first = True
+    pending: list[bytes] = []
+    pending_size = 0
+    for item in items:
+        # Nest the item one level into the array (newlines inside JSON
+        # strings are escaped, so only structural newlines are indented)
+        chunk = to_json(item, indent=2, by_alias=True).replace(b"\n", b"\n  ")
+        pending.append(b"[\n  " if first else b",\n  ")
+        pending.append(chunk)
+        pending_size += len(chunk)
+        first = False
+        # Write in batches rather than one system call per item
+        if pending_size >= JSON_WRITE_BATCH_BYTES:
+            _write_stdout(b"".join(pending))
+            pending.clear()
+            pending_size = 0
+    pending.append(b"[]\n" if first else b"\n]\n")
+    _write_stdout(b"".join(pending))
 
 
 def output_table(
-    data: Sequence[BaseModel],
-    columns: list[tuple[str, str]],
+    data: Iterable["BaseModel"],
+    columns: Sequence[tuple[str, str]],
     title: str | None = None,
 ) -> None:
     """Output data as a Rich table.
 
     Args:
-        data: List of Pydantic models to display
-        columns: List of (attribute_name, column_header) tuples
+        data: Pydantic models to display (consumed once)
+        columns: Sequence of (attribute_name, column_header) tuples
         title: Optional table title
     """
+    from rich.table import Table
+
     table = Table(title=title)
 
     for _, header in columns:
         table.add_column(header)
 
+    attrs = [attr for attr, _ in columns]
     for item in data:
-        row: list[str] = []
-        for attr, _ in columns:
-            value = getattr(item, attr, "")
-            if value is None:
-                value = ""
-            row.append(str(value))
-        table.add_row(*row)
+        values = [getattr(item, attr, None) for attr in attrs]
+        table.add_row(*["" if v is None else str(v) for v in values])
 
-    console.print(table)
+    get_console().print(table)
 
 
 def output_panel(
-    data: BaseModel,
-    fields: list[tuple[str, str]],
+    data: "BaseModel",
+    fields: Sequence[tuple[str, str]],
     title: str,
 ) -> None:
     """Output a single item as a Rich panel.
 
     Args:
         data: Pydantic model to display
-        fields: List of (attribute_name, display_label) tuples
+        fields: Sequence of (attribute_name, display_label) tuples
         title: Panel title
     """
     lines: list[str] = []
@@ -72,26 +130,55 @@ def output_panel(
         if value is not None:
             lines.append(f"[bold]{label}:[/bold] {value}")
 
-    content = "\n".join(lines)
-    panel = Panel(content, title=title)
-    console.print(panel)
+    output_text_panel("\n".join(lines), title)
+
+
+def output_text_panel(content: "RenderableType", title: str) -> None:
+    """Output Rich markup text, or another renderable, in a panel.
+
+    Args:
+        content: Panel body (Rich markup or a renderable such as Text)
+        title: Panel title
+    """
+    from rich.panel import Panel
+
+    get_console().print(Panel(content, title=title))
+
+
+def _use_color(stream: TextIO) -> bool:
+    """Whether to color messages written to stream, following Rich's rules."""
+    if os.environ.get("NO_COLOR") or os.environ.get("TERM") in ("dumb", "unknown"):
+        return False
+    return stream.isatty()
+
+
+def _write_message(stream: TextIO, message: str, color: str, prefix: str = "") -> None:
+    """Write a one-line message in a fixed color, bypassing Rich.
+
+    The message is written as-is, so brackets in names aren't read as markup.
+    """
+    start, end = (color, _RESET) if _use_color(stream) else ("", "")
+    if prefix:
+        stream.write(f"{start}{prefix}{end} {message}\n")
+    else:
+        stream.write(f"{start}{message}{end}\n")
 
 
 def output_error(message: str) -> None:
     """Output an error message."""
-    error_console.print(f"[red]Error:[/red] {message}")
+    _write_message(sys.stderr, message, _RED, prefix="Error:")
 
 
 def output_success(message: str) -> None:
     """Output a success message."""
-    console.print(f"[green]{message}[/green]")
+    _write_message(sys.stdout, message, _GREEN)
 
 
 def output_warning(message: str) -> None:
     """Output a warning message."""
-    console.print(f"[yellow]{message}[/yellow]")
+    _write_message(sys.stdout, message, _YELLOW)
 
 
 def output_info(message: str) -> None:
-    """Output an info message."""
-    console.print(message)
+    """Output an info message, which may contain Rich markup."""
+    get_console().print(message)
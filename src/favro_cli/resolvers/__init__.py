@@ -1,15 +1,37 @@
 """Entity name resolvers for Favro CLI."""
 
-from .base import AmbiguousMatchError, NotFoundError, ResolverError
-from .board import BoardResolver
-from .card import CardResolver
-from .column import ColumnResolver
-from .organization import OrganizationResolver
-from .tag import TagResolver
-from .user import UserResolver
+import importlib
+from typing import TYPE_CHECKING, Any
+
+from .base import AmbiguousMatchError, NotFoundError, ResolverError, looks_like_id
+
+if TYPE_CHECKING:
+    from .batch import BatchResolver, BatchResult
+    from .board import BoardResolver
+    from .card import CardResolver
+    from .column import ColumnResolver
+    from .organization import OrganizationResolver
+    from .tag import TagResolver
+    from .user import UserResolver
+
+# Resolver classes pull in the API client and models, so each is imported
+# from its module on first access (PEP 562). The base exceptions and helpers
+# above are lightweight and always available.
+_RESOLVER_MODULES = {
+    "BatchResolver": ".batch",
+    "BatchResult": ".batch",
+    "BoardResolver": ".board",
+    "CardResolver": ".card",
+    "ColumnResolver": ".column",
+    "OrganizationResolver": ".organization",
+    "TagResolver": ".tag",
+    "UserResolver": ".user",
+}
 
 __all__ = [
     "AmbiguousMatchError",
+    "BatchResolver",
+    "BatchResult",
     "BoardResolver",
     "CardResolver",
     "ColumnResolver",
@@ -18,4 +40,12 @@ __all__ = [
     "ResolverError",
     "TagResolver",
     "UserResolver",
+    "looks_like_id",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _RESOLVER_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name, __name__), name)
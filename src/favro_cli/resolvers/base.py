@@ -1,5 +1,6 @@
 """Base resolver class and exceptions for entity name resolution."""
 
+import re
 from abc import ABC, abstractmethod
 from typing import TYPE_CHECKING, Generic, TypeVar
 
@@ -8,6 +9,14 @@ if TYPE_CHECKING:
 
 T = TypeVar("T")
 
+# Favro entity IDs are long alphanumeric strings
+ID_PATTERN = re.compile(r"[A-Za-z0-9]{16,}")
+
+
+def looks_like_id(identifier: str) -> bool:
+    """Check whether an identifier has the shape of a Favro entity ID."""
+    return ID_PATTERN.fullmatch(identifier) is not None
+
 
 class ResolverError(Exception):
     """Base exception for resolver errors."""
@@ -50,12 +59,14 @@ class BaseResolver(ABC, Generic[T]):
     """Base class for entity resolvers.
 
     Resolves identifiers (ID or name) to entities using auto-detection:
-    1. Try to fetch by ID directly (fast path)
+    1. Try to fetch by ID directly if the identifier looks like one (fast path)
     2. If not found, search by name (case-insensitive)
     3. Handle duplicate names with helpful error
     """
 
     entity_type: str = "entity"  # Override in subclass
+    # Kind of client list that _fetch_all may serve from the disk cache
+    list_kind: str | None = None
 
     def __init__(self, client: "FavroClient") -> None:
         self.client = client
@@ -65,6 +76,11 @@ class BaseResolver(ABC, Generic[T]):
         """Fetch all entities of this type. Override in subclass."""
         pass
 
+    def _fetch_all_cached(self, **context: str | None) -> list[T]:
+        """Fetch all entities, reusing an earlier fetch made with this client."""
+        key = (self.entity_type, *sorted(context.items()))
+        return self.client.memoize(key, lambda: self._fetch_all(**context))
+
     @abstractmethod
     def _fetch_by_id(self, entity_id: str) -> T | None:
         """Fetch single entity by ID. Returns None if not found."""
@@ -84,7 +100,7 @@ class BaseResolver(ABC, Generic[T]):
         """Resolve an identifier to an entity.
 
         Strategy:
-        1. Try to fetch by ID directly (fast path)
+        1. Try to fetch by ID directly if it looks like an ID (fast path)
         2. If not found, search by name
         3. Handle duplicate names with error
 
@@ -99,18 +115,30 @@ class BaseResolver(ABC, Generic[T]):
             NotFoundError: Entity not found
             AmbiguousMatchError: Multiple entities match
         """
-        # First, try as an ID (fast path)
-        try:
-            entity = self._fetch_by_id(identifier)
-            if entity is not None:
-                return entity
-        except Exception:
-            pass  # Not a valid ID, try name lookup
+        # First, try as an ID (fast path). Names can't be IDs, so skip the
+        # request that would only come back as not found.
+        if looks_like_id(identifier):
+            try:
+                entity = self._fetch_by_id(identifier)
+                if entity is not None:
+                    return entity
+            except Exception:
+                pass  # Not a valid ID, try name lookup
 
         # Fetch all and search by name (case-insensitive)
-        entities = self._fetch_all(**context)
+        entities = self._fetch_all_cached(**context)
         matches = [e for e in entities if self._get_name(e).lower() == identifier.lower()]
 
+        list_kind = self.list_kind
+        if not matches and list_kind and self.client.used_cached_list(list_kind):
+            # The cached list may predate the entity, so search a fresh one
+            self.client.forget(list_kind)
+            self.client.forget(self.entity_type)
+            entities = self._fetch_all_cached(**context)
+            matches = [
+                e for e in entities if self._get_name(e).lower() == identifier.lower()
+            ]
+
         if len(matches) == 0:
             raise NotFoundError(self.entity_type, identifier)
         elif len(matches) == 1:
@@ -0,0 +1,123 @@
+"""Batch resolver for the entities a command refers to."""
+
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from favro_cli.api.models import Card, Column, Tag, User
+
+from .base import looks_like_id
+from .board import BoardResolver
+from .card import CardResolver
+from .column import ColumnResolver
+from .tag import TagResolver
+from .user import UserResolver
+
+if TYPE_CHECKING:
+    from favro_cli.api.client import FavroClient
+
+# Lookups run at once, matching the client's connection pool
+MAX_WORKERS = 8
+
+
+@dataclass
+class BatchResult:
+    """Entities resolved by BatchResolver, in the order they were given.
+
+    Entities that weren't requested (or were skipped) are None or empty.
+    """
+
+    board_id: str | None = None
+    card: Card | None = None
+    column: Column | None = None
+    add_users: list[User] = field(default_factory=list)
+    remove_users: list[User] = field(default_factory=list)
+    add_tags: list[Tag] = field(default_factory=list)
+    remove_tags: list[Tag] = field(default_factory=list)
+
+
+class BatchResolver:
+    """Resolves all of a command's identifiers with overlapping lookups.
+
+    Users and tags don't depend on the board, so they are resolved while
+    the board is. Only the board's ID is needed, so the selected board isn't
+    looked up at all. The card and column need the board for sequential ID
+    and name lookups, so they are resolved together once it is known.
+    Lookups share the client, so repeated user or tag lists are fetched once.
+    """
+
+    def __init__(self, client: "FavroClient") -> None:
+        self.client = client
+        self.card_resolver = CardResolver(client)
+
+    def resolve(
+        self,
+        board: str | None = None,
+        card: str | None = None,
+        column: str | None = None,
+        add_users: Sequence[str] = (),
+        remove_users: Sequence[str] = (),
+        add_tags: Sequence[str] = (),
+        remove_tags: Sequence[str] = (),
+        skip_card_ids: bool = False,
+    ) -> BatchResult:
+        """Resolve the given identifiers.
+
+        Args:
+            board: Board ID or name, giving context for the card and column
+            card: Card ID, sequential ID, or name
+            column: Column ID or name
+            add_users: User IDs, names, or emails
+            remove_users: User IDs, names, or emails
+            add_tags: Tag IDs or names
+            remove_tags: Tag IDs or names
+            skip_card_ids: Leave the card unresolved (None) if the identifier
+                looks like a card ID, for callers that address it directly
+
+        Raises:
+            ResolverError: An identifier couldn't be resolved
+            ValueError: Missing board for a lookup that needs one
+        """
+        result = BatchResult()
+        user_resolver = UserResolver(self.client)
+        tag_resolver = TagResolver(self.client)
+
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            # Independent of the board, so started first
+            user_futures = [
+                [executor.submit(user_resolver.resolve, u) for u in users]
+                for users in (add_users, remove_users)
+            ]
+            tag_futures = [
+                [executor.submit(tag_resolver.resolve, t) for t in tags]
+                for tags in (add_tags, remove_tags)
+            ]
+
+            if board:
+                result.board_id = BoardResolver(self.client).resolve_id(board)
+            board_id = result.board_id
+
+            card_future: Future[Card] | None = None
+            if card and not (skip_card_ids and looks_like_id(card)):
+                card_future = executor.submit(
+                    self.card_resolver.resolve, card, board_id=board_id
+                )
+            column_future: Future[Column] | None = None
+            if column:
+                column_future = executor.submit(
+                    ColumnResolver(self.client).resolve, column, board_id=board_id
+                )
+
+            if card_future is not None:
+                result.card = card_future.result()
+            if column_future is not None:
+                result.column = column_future.result()
+            result.add_users, result.remove_users = (
+                [f.result() for f in futures] for futures in user_futures
+            )
+            result.add_tags, result.remove_tags = (
+                [f.result() for f in futures] for futures in tag_futures
+            )
+
+        return result
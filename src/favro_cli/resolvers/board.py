@@ -1,13 +1,23 @@
 """Board (Widget) resolver."""
 
-from favro_cli.api.client import FavroNotFoundError
+import threading
+
+from favro_cli.api.client import FavroClient
+from favro_cli.api.errors import FavroNotFoundError
 from favro_cli.api.models import Widget
+from favro_cli.cache import get_cached_widget, set_cached_widget
+from favro_cli.config import get_board_id
 
 from .base import BaseResolver
 
 
 class BoardResolver(BaseResolver[Widget]):
-    """Resolver for boards/widgets."""
+    """Resolver for boards/widgets.
+
+    Resolved boards are cached on disk per organization. Fresh entries are
+    returned without a network call; stale entries are returned immediately
+    while a background thread refreshes them (stale-while-revalidate).
+    """
 
     entity_type = "board"
 
@@ -25,3 +35,59 @@ class BoardResolver(BaseResolver[Widget]):
 
     def _get_name(self, entity: Widget) -> str:
         return entity.name
+
+    def resolve(self, identifier: str, **context: str | None) -> Widget:
+        """Resolve a board by ID or name, using the local cache when possible."""
+        scope = self.client.cache_scope
+        if scope is None:
+            return super().resolve(identifier, **context)
+
+        cached = get_cached_widget(scope, identifier)
+        if cached is not None:
+            widget, is_fresh = cached
+            if not is_fresh:
+                # A daemon, so the command doesn't wait for it at exit; a
+                # refresh cut short just leaves the entry stale for next time
+                threading.Thread(
+                    target=self._refresh,
+                    args=(scope, identifier),
+                    name="favro-board-refresh",
+                    daemon=True,
+                ).start()
+            return widget
+
+        widget = super().resolve(identifier, **context)
+        set_cached_widget(scope, identifier, widget)
+        return widget
+
+    def resolve_id(self, identifier: str) -> str:
+        """Resolve a board to its widget common ID.
+
+        For commands that need only the ID. The selected board was resolved
+        when it was saved, so it is returned without a lookup. Other
+        identifiers are resolved (usually from the local cache), since a
+        board name can look like an ID.
+        """
+        if identifier == get_board_id():
+            return identifier
+        return self.resolve(identifier).widget_common_id
+
+    def resolve_uncached(self, identifier: str, **context: str | None) -> Widget:
+        """Resolve a board without reading the local cache."""
+        return super().resolve(identifier, **context)
+
+    def _refresh(self, scope: str, identifier: str) -> None:
+        """Re-resolve a board and update the cache.
+
+        Uses its own client since the command's client may be closed before
+        the refresh completes. Errors are ignored; the stale entry expires.
+        """
+        client = self.client
+        try:
+            with FavroClient(
+                client.email, client.token, client.organization_id
+            ) as refresh_client:
+                widget = BoardResolver(refresh_client).resolve_uncached(identifier)
+            set_cached_widget(scope, identifier, widget)
+        except Exception:
+            pass
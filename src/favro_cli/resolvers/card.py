@@ -2,10 +2,10 @@
 
 import re
 
-from favro_cli.api.client import FavroNotFoundError
+from favro_cli.api.errors import FavroNotFoundError
 from favro_cli.api.models import Card
 
-from .base import AmbiguousMatchError, BaseResolver, NotFoundError
+from .base import AmbiguousMatchError, BaseResolver, NotFoundError, looks_like_id
 
 
 class CardResolver(BaseResolver[Card]):
@@ -43,7 +43,14 @@ class CardResolver(BaseResolver[Card]):
             return int(match.group(1))
         return None
 
-    def resolve(self, identifier: str, board_id: str | None = None, **context: str | None) -> Card:
+    def resolve(
+        self,
+        identifier: str,
+        board_id: str | None = None,
+        *,
+        id_lookup: bool = True,
+        **context: str | None,
+    ) -> Card:
         """Resolve card identifier.
 
         Supports:
@@ -54,6 +61,8 @@ class CardResolver(BaseResolver[Card]):
         Args:
             identifier: Card ID, sequential ID, or name
             board_id: Board ID required for sequential ID or name lookup
+            id_lookup: Try the identifier as a card ID. Pass False when a
+                request to it already came back as not found.
 
         Returns:
             The resolved card
@@ -70,8 +79,13 @@ class CardResolver(BaseResolver[Card]):
                 raise ValueError(
                     f"Looking up card by sequential ID (#{seq_id}) requires --board option"
                 )
-            # Search by sequential ID
-            cards = self._fetch_all(board_id=board_id)
+            # Search by sequential ID, letting the API filter the board's cards
+            cards = self.client.memoize(
+                (self.entity_type, board_id, seq_id),
+                lambda: self.client.get_cards(
+                    widget_common_id=board_id, sequential_id=seq_id
+                ),
+            )
             matches = [c for c in cards if c.sequential_id == seq_id]
 
             if len(matches) == 0:
@@ -86,13 +100,14 @@ class CardResolver(BaseResolver[Card]):
                 ]
                 raise AmbiguousMatchError(self.entity_type, identifier, match_info)
 
-        # Try direct ID lookup first
-        try:
-            entity = self._fetch_by_id(identifier)
-            if entity is not None:
-                return entity
-        except Exception:
-            pass  # Not a valid ID, try name lookup
+        # Try direct ID lookup first, if it looks like an ID
+        if id_lookup and looks_like_id(identifier):
+            try:
+                entity = self._fetch_by_id(identifier)
+                if entity is not None:
+                    return entity
+            except Exception:
+                pass  # Not a valid ID, try name lookup
 
         # Name lookup requires board_id
         if board_id is None:
@@ -102,7 +117,7 @@ class CardResolver(BaseResolver[Card]):
             )
 
         # Fall back to name search
-        cards = self._fetch_all(board_id=board_id)
+        cards = self._fetch_all_cached(board_id=board_id)
         matches = [c for c in cards if self._get_name(c).lower() == identifier.lower()]
 
         if len(matches) == 0:
@@ -1,24 +1,34 @@
 """Column resolver (requires board context for name resolution)."""
 
-from favro_cli.api.client import FavroNotFoundError
+from favro_cli.api.errors import FavroNotFoundError
 from favro_cli.api.models import Column
 
 from .base import BaseResolver
+from .board import BoardResolver
 
 
 class ColumnResolver(BaseResolver[Column]):
     """Resolver for columns.
 
-    Note: Name resolution requires board_id context since column names
-    are only unique within a board.
+    Note: Name resolution requires board context since column names
+    are only unique within a board. Pass board_id, or board (a board ID or
+    name) to have the board resolved only if a name lookup needs it.
     """
 
     entity_type = "column"
-
-    def _fetch_all(self, board_id: str | None = None, **context: str | None) -> list[Column]:
+    list_kind = "columns"
+
+    def _fetch_all(
+        self,
+        board_id: str | None = None,
+        board: str | None = None,
+        **context: str | None,
+    ) -> list[Column]:
+        if board_id is None and board is not None:
+            board_id = BoardResolver(self.client).resolve_id(board)
         if board_id is None:
             raise ValueError("board_id is required to resolve columns by name")
-        return self.client.get_columns(board_id)
+        return self.client.get_columns(board_id, use_cache=True)
 
     def _fetch_by_id(self, entity_id: str) -> Column | None:
         try:
@@ -1,6 +1,6 @@
 """Organization resolver."""
 
-from favro_cli.api.client import FavroNotFoundError
+from favro_cli.api.errors import FavroNotFoundError
 from favro_cli.api.models import Organization
 
 from .base import BaseResolver
@@ -1,6 +1,6 @@
 """Tag resolver."""
 
-from favro_cli.api.client import FavroNotFoundError
+from favro_cli.api.errors import FavroNotFoundError
 from favro_cli.api.models import Tag
 
 from .base import BaseResolver
@@ -10,6 +10,7 @@ class TagResolver(BaseResolver[Tag]):
     """Resolver for tags."""
 
     entity_type = "tag"
+    list_kind = "tags"
 
     def _fetch_all(self, **context: str | None) -> list[Tag]:
         return self.client.get_tags()
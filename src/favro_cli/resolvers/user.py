@@ -1,6 +1,6 @@
 """User resolver (supports ID, name, and email)."""
 
-from favro_cli.api.client import FavroNotFoundError
+from favro_cli.api.errors import FavroNotFoundError
 from favro_cli.api.models import User
 
 from .base import AmbiguousMatchError, BaseResolver, NotFoundError
@@ -16,6 +16,7 @@ class UserResolver(BaseResolver[User]):
     """
 
     entity_type = "user"
+    list_kind = "users"
 
     def _fetch_all(self, **context: str | None) -> list[User]:
         return self.client.get_users()
@@ -52,7 +53,7 @@ class UserResolver(BaseResolver[User]):
             pass  # Not found by ID or name, try email
 
         # Try email match
-        users = self._fetch_all()
+        users = self._fetch_all_cached()
         email_matches = [u for u in users if u.email.lower() == identifier.lower()]
 
         if len(email_matches) == 1:
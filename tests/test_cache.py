@@ -0,0 +1,211 @@
+"""Tests for the local cache."""
+
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from favro_cli import cache
+from favro_cli.api.models import Widget
+
+SCOPE = "alice@example.com/org1"
+OTHER_SCOPE = "bob@example.com/org1"
+
+
+@pytest.fixture(autouse=True)
+def cache_home(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Path:
+    """Point the cache at a temporary directory."""
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    return tmp_path / "favro-cli"
+
+
+def make_widget(widget_id: str = "Widget1", name: str = "Main Board") -> Widget:
+    return Widget.model_validate(
+        {
+            "widgetCommonId": widget_id,
+            "organizationId": "org1",
+            "name": name,
+            "type": "board",
+        }
+    )
+
+
+def advance_clock(monkeypatch: pytest.MonkeyPatch, seconds: float) -> None:
+    """Make the cache see the time as this many seconds from now."""
+    now = time.time()
+    monkeypatch.setattr(cache.time, "time", lambda: now + seconds)
+
+
+def test_cache_dir_follows_xdg(cache_home: Path) -> None:
+    assert cache.get_cache_dir() == cache_home
+
+
+def test_widget_round_trip() -> None:
+    widget = make_widget()
+    cache.set_cached_widget(SCOPE, "Main Board", widget)
+
+    assert cache.get_cached_widget(SCOPE, "Main Board") == (widget, True)
+    assert cache.get_cached_widget(SCOPE, "Other Board") is None
+    assert cache.get_cached_widget(OTHER_SCOPE, "Main Board") is None
+
+
+def test_widget_goes_stale_then_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    widget = make_widget()
+    cache.set_cached_widget(SCOPE, "Main Board", widget)
+
+    advance_clock(monkeypatch, cache.WIDGET_FRESH_SECONDS + 1)
+    assert cache.get_cached_widget(SCOPE, "Main Board") == (widget, False)
+
+    advance_clock(monkeypatch, cache.WIDGET_STALE_SECONDS + 1)
+    assert cache.get_cached_widget(SCOPE, "Main Board") is None
+
+
+def test_clear_widget_cache_keeps_other_scopes() -> None:
+    cache.set_cached_widget(SCOPE, "Main Board", make_widget())
+    cache.set_cached_widget(OTHER_SCOPE, "Main Board", make_widget())
+
+    cache.clear_widget_cache(SCOPE)
+
+    assert cache.get_cached_widget(SCOPE, "Main Board") is None
+    assert cache.get_cached_widget(OTHER_SCOPE, "Main Board") is not None
+
+
+def test_list_round_trip() -> None:
+    users = [{"userId": "User1", "name": "Alice"}]
+    cache.set_cached_list(SCOPE, "users", users)
+
+    assert cache.get_cached_list(SCOPE, "users") == users
+    assert cache.get_cached_list(SCOPE, "tags") is None
+    assert cache.get_cached_list(OTHER_SCOPE, "users") is None
+
+
+def test_list_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    cache.set_cached_list(SCOPE, "users", [{"userId": "User1"}])
+
+    advance_clock(monkeypatch, cache.LIST_CACHE_SECONDS + 1)
+    assert cache.get_cached_list(SCOPE, "users") is None
+
+
+def test_clear_list_cache_by_kind() -> None:
+    cache.set_cached_list(SCOPE, "columns:Widget1", [{"columnId": "Col1"}])
+    cache.set_cached_list(SCOPE, "columns:Widget2", [{"columnId": "Col2"}])
+    cache.set_cached_list(SCOPE, "users", [{"userId": "User1"}])
+
+    cache.clear_list_cache(SCOPE, "columns")
+
+    assert cache.get_cached_list(SCOPE, "columns:Widget1") is None
+    assert cache.get_cached_list(SCOPE, "columns:Widget2") is None
+    assert cache.get_cached_list(SCOPE, "users") is not None
+
+
+def test_clear_list_cache_whole_scope() -> None:
+    cache.set_cached_list(SCOPE, "users", [{"userId": "User1"}])
+    cache.set_cached_list(OTHER_SCOPE, "users", [{"userId": "User2"}])
+
+    cache.clear_list_cache(SCOPE)
+
+    assert cache.get_cached_list(SCOPE, "users") is None
+    assert cache.get_cached_list(OTHER_SCOPE, "users") is not None
+
+
+def test_card_round_trip() -> None:
+    cache.set_cached_cards(SCOPE, {"Card1": ('"etag1"', '{"cardId": "Card1"}')})
+
+    assert cache.get_cached_cards(SCOPE) == {
+        "Card1": ('"etag1"', '{"cardId": "Card1"}')
+    }
+    assert cache.get_cached_cards(OTHER_SCOPE) == {}
+
+
+def test_cards_evict_least_recently_fetched(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(cache, "CARD_CACHE_MAX_ENTRIES", 2)
+    cache.set_cached_cards(SCOPE, {"Card1": ("e1", "{}"), "Card2": ("e2", "{}")})
+    # Fetching Card1 again makes Card2 the oldest entry
+    cache.set_cached_cards(SCOPE, {"Card1": ("e1b", "{}"), "Card3": ("e3", "{}")})
+
+    assert cache.get_cached_cards(SCOPE) == {
+        "Card1": ("e1b", "{}"),
+        "Card3": ("e3", "{}"),
+    }
+
+
+def test_clear_lookup_caches_keeps_cards() -> None:
+    cache.set_cached_widget(SCOPE, "Main Board", make_widget())
+    cache.set_cached_list(SCOPE, "users", [{"userId": "User1"}])
+    cache.set_cached_cards(SCOPE, {"Card1": ("e1", "{}")})
+
+    cache.clear_lookup_caches()
+
+    assert cache.get_cached_widget(SCOPE, "Main Board") is None
+    assert cache.get_cached_list(SCOPE, "users") is None
+    assert cache.get_cached_cards(SCOPE) == {"Card1": ("e1", "{}")}
+
+
+def test_clear_cache_removes_everything(cache_home: Path) -> None:
+    cache.set_cached_widget(SCOPE, "Main Board", make_widget())
+    cache.set_cached_list(SCOPE, "users", [{"userId": "User1"}])
+    cache.set_cached_cards(SCOPE, {"Card1": ("e1", "{}")})
+
+    cache.clear_cache()
+
+    assert not cache_home.exists()
+    assert cache.get_cached_widget(SCOPE, "Main Board") is None
+    assert cache.get_cached_list(SCOPE, "users") is None
+    assert cache.get_cached_cards(SCOPE) == {}
+
+
+@pytest.mark.parametrize("contents", [b"{not json", b"[1, 2]", b""])
+def test_corrupt_files_read_as_empty(cache_home: Path, contents: bytes) -> None:
+    cache_home.mkdir(parents=True)
+    for path in (
+        cache.get_widget_cache_path(),
+        cache.get_list_cache_path(),
+        cache.get_card_cache_path(),
+    ):
+        path.write_bytes(contents)
+
+    assert cache.get_cached_widget(SCOPE, "Main Board") is None
+    assert cache.get_cached_list(SCOPE, "users") is None
+    assert cache.get_cached_cards(SCOPE) == {}
+
+    # A corrupt file is replaced on the next write
+    cache.set_cached_list(SCOPE, "users", [{"userId": "User1"}])
+    assert cache.get_cached_list(SCOPE, "users") == [{"userId": "User1"}]
+
+
+def test_malformed_entries_are_misses(cache_home: Path) -> None:
+    cache_home.mkdir(parents=True)
+    cache.get_widget_cache_path().write_text(
+        '{"%s": {"Main Board": {"cached_at": "now", "widget": {}}}}' % SCOPE
+    )
+    cache.get_list_cache_path().write_text(
+        '{"%s": {"users": {"cached_at": 0, "items": "nope"}}}' % SCOPE
+    )
+    cache.get_card_cache_path().write_text(
+        '{"%s": {"Card1": {"etag": 1}, "Card2": "nope"}}' % SCOPE
+    )
+
+    assert cache.get_cached_widget(SCOPE, "Main Board") is None
+    assert cache.get_cached_list(SCOPE, "users") is None
+    assert cache.get_cached_cards(SCOPE) == {}
+
+
+def test_concurrent_writers_keep_every_entry(cache_home: Path) -> None:
+    keys = [f"columns:Widget{i}" for i in range(20)]
+    start = threading.Barrier(len(keys))
+
+    def write(key: str) -> None:
+        start.wait()
+        cache.set_cached_list(SCOPE, key, [{"columnId": key}])
+
+    threads = [threading.Thread(target=write, args=(key,)) for key in keys]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    for key in keys:
+        assert cache.get_cached_list(SCOPE, key) == [{"columnId": key}]
+    # No temporary files are left behind
+    assert [p.name for p in cache_home.iterdir()] == ["lists.json"]